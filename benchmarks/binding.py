@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmark: argument binding
+---------------------------
+
+Cost of turning the arguments of each plotting class into instance
+attributes, using the previous ``inspect.signature`` + ``eval`` loop
+and the compiled binder of ``mpl_plotter.methods.binding``.
+
+    python benchmarks/binding.py
+"""
+
+import inspect
+import timeit
+
+from mpl_plotter.two_d import line, scatter, heatmap, quiver, streamline, fill_area
+from mpl_plotter.three_d import line as line3, scatter as scatter3, surface as surface3
+
+
+def legacy(cls, self, args):
+    for item in inspect.signature(cls).parameters:
+        setattr(self, item, eval(item, None, args))
+
+
+def compiled(cls, self, args):
+    cls._bind(self, args)
+
+
+def run(n=2000):
+
+    print(f'{"plotter":<24}{"arguments":>10}{"legacy [us]":>14}{"compiled [us]":>16}{"speedup":>10}')
+
+    for cls in [line, scatter, heatmap, quiver, streamline, fill_area, line3, scatter3, surface3]:
+
+        args = {k: v.default for k, v in inspect.signature(cls).parameters.items()}
+        self = cls.__new__(cls)
+
+        t_legacy   = timeit.timeit(lambda: legacy(cls, self, args),   number=n)/n*1e6
+        t_compiled = timeit.timeit(lambda: compiled(cls, self, args), number=n)/n*1e6
+
+        name = f'{cls.__module__.split(".")[1]}.{cls.__name__}'
+        print(f'{name:<24}{len(args):>10}{t_legacy:>14.1f}{t_compiled:>16.1f}{t_legacy/t_compiled:>9.0f}x')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmark: fill_area envelopes and intersections
+------------------------------------------------
+
+Scaling of ``fill_area.i_below``, ``i_above`` and ``intersection`` from
+1e3 to 1e7 points, using the previous per-sample Python loops and the
+vectorized NumPy kernels. The loops are skipped above ``legacy_max``
+points.
+
+    python benchmarks/fill_area.py
+"""
+
+import timeit
+
+import numpy as np
+
+from mpl_plotter.two_d import fill_area
+
+
+def legacy_below(y, z):
+    c = np.zeros(y.shape, dtype=float)
+    for i in range(len(c)):
+        c[i] = y[i] if y[i] <= z[i] else z[i]
+    return c
+
+
+def legacy_above(y, z):
+    c = np.zeros(y.shape, dtype=float)
+    for i in range(len(c)):
+        c[i] = y[i] if y[i] >= z[i] else z[i]
+    return c
+
+
+def legacy_intersection(y, z):
+    return np.nonzero(np.absolute(y - z) == min(np.absolute(y - z)))[0]
+
+
+def run(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), legacy_max=10**6):
+
+    print(f'{"points":>10}{"legacy [ms]":>14}{"vectorized [ms]":>18}{"speedup":>10}')
+
+    for n in sizes:
+
+        plot   = fill_area.__new__(fill_area)
+        plot.x = np.linspace(-6, 6, n)
+        plot.y = np.sin(plot.x)
+        plot.z = np.cos(plot.x)
+
+        number = max(1, 10**6//n)
+
+        t_vectorized = timeit.timeit(lambda: (plot.i_below(), plot.i_above(), plot.intersection()),
+                                     number=number)/number*1e3
+
+        if n <= legacy_max:
+            t_legacy = timeit.timeit(lambda: (legacy_below(plot.y, plot.z),
+                                              legacy_above(plot.y, plot.z),
+                                              legacy_intersection(plot.y, plot.z)),
+                                     number=1)*1e3
+            print(f'{n:>10.0e}{t_legacy:>14.1f}{t_vectorized:>18.2f}{t_legacy/t_vectorized:>9.0f}x')
+        else:
+            print(f'{n:>10.0e}{"-":>14}{t_vectorized:>18.2f}{"-":>10}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmark: import time
+----------------------
+
+Cumulative import time of each MPL Plotter entry point, parsed from
+``python -X importtime`` in a fresh interpreter, and check that the
+modules loaded lazily (on first use) are not imported with it.
+
+    python benchmarks/imports.py
+
+Exits with status 1 if any lazily loaded module is imported.
+"""
+
+import re
+import sys
+import subprocess
+
+
+# Entry point -> modules which must not be imported with it
+LAZY = {
+    'mpl_plotter':         ['pandas', 'toml', 'matplotlib.pyplot', 'matplotlib.figure', 'mpl_toolkits.mplot3d',
+                            'mpl_plotter.two_d', 'mpl_plotter.three_d', 'mpl_plotter.presets'],
+    'mpl_plotter.two_d':   ['pandas', 'toml', 'matplotlib.pyplot', 'matplotlib.figure', 'mpl_toolkits.mplot3d',
+                            'mpl_plotter.three_d', 'mpl_plotter.presets'],
+    'mpl_plotter.three_d': ['pandas', 'toml', 'matplotlib.pyplot', 'mpl_plotter.presets'],
+    'mpl_plotter.presets': ['pandas', 'toml', 'matplotlib.pyplot'],
+}
+
+
+def importtime(module):
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    :return: Dictionary of imported modules and their cumulative import time in microseconds
+    """
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)', line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+
+    return times
+
+
+def run(repeat=5):
+
+    regressions = []
+
+    print(f'{"module":<24}{"import [ms]":>12}   eagerly imported')
+
+    for module, lazy in LAZY.items():
+
+        runs  = [importtime(module) for _ in range(repeat)]
+        best  = min(times[module] for times in runs)/1e3
+        eager = [m for m in lazy if m in runs[0]]
+
+        regressions += eager
+
+        print(f'{module:<24}{best:>12.1f}   {", ".join(eager) if eager else "-"}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
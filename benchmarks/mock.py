@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmark: mock data
+--------------------
+
+Time taken by the ``MockData`` generators to produce datasets of
+increasing size.
+
+    python benchmarks/mock.py
+"""
+
+import timeit
+
+from mpl_plotter.two_d.mock import MockData
+
+
+def run():
+
+    generators = {'filled_julia': (120, 240, 480, 960, 1920),
+                  'spirograph':   (10**3, 10**4, 10**5, 10**6, 10**7),
+                  'waterdrop':    (250, 500, 1000, 2000, 4000)}
+
+    print(f'{"generator":<16}{"size":>10}{"time [ms]":>12}')
+
+    for name, sizes in generators.items():
+        for size in sizes:
+            t = timeit.timeit(lambda: getattr(MockData(), name)(size=size), number=1)*1e3
+            print(f'{name:<16}{size:>10}{t:>12.1f}')
+
+
+if __name__ == '__main__':
+    run()
@@ -2,8 +2,6 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import re
-import matplotlib as mpl
-import matplotlib.font_manager
 
 
 """
@@ -31,16 +29,21 @@ def figure(figsize=(6, 6), backend='Qt5Agg'):
 
     :return: Figure object
     """
+    import matplotlib as mpl
     if not isinstance(backend, type(None)):
         mpl.use(backend)
     import matplotlib.pyplot as plt
     return plt.figure(figsize=figsize)
 
 
+from mpl_plotter.render import render_batch, render_parallel, figure_pool, RenderError
+
+
 def get_available_fonts():
     """
     Print all fonts available to Matplotlib in your system.
     """
+    import matplotlib.font_manager
     flist = matplotlib.font_manager.get_fontconfig_fonts()
     names = [matplotlib.font_manager.FontProperties(fname=fname).get_name() for fname in flist]
 
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Caching
+-------
+"""
+
+import hashlib
+import inspect
+import threading
+
+from functools import wraps
+from collections import OrderedDict
+
+import numpy as np
+
+
+class cache:
+    """
+    Process-level, least recently used cache of NumPy arrays, bounded by
+    the total size of the arrays it holds.
+
+    Values are arrays, or tuples of arrays. Arrays are stored read-only
+    and returned as such on every hit, so that callers sharing them cannot
+    modify them. Once ``max_bytes`` is exceeded, the least recently used
+    values are evicted. Values larger than ``max_bytes`` are not stored.
+
+    :param max_bytes: Maximum total size of the cached arrays [bytes]
+
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes=2**28):
+        self.max_bytes = max_bytes
+        self.values    = OrderedDict()      # key -> (value, size)
+        self.nbytes    = 0
+        self.lock      = threading.Lock()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.values:
+                return default
+            self.values.move_to_end(key)
+            return self.values[key][0]
+
+    def put(self, key, value):
+        """
+        Store ``value``, made read-only, and return it. Other values are
+        returned as they are, without storing them.
+        """
+
+        arrays = value if isinstance(value, tuple) else (value,)
+        if not all(isinstance(a, np.ndarray) for a in arrays):
+            return value
+
+        # Views are copied, so that the arrays they are taken from are not
+        # kept alive outside of the memory accounted for
+        arrays = tuple(a.copy() if a.base is not None else a for a in arrays)
+        for a in arrays:
+            a.flags.writeable = False
+        value = arrays if isinstance(value, tuple) else arrays[0]
+
+        size = sum(a.nbytes for a in arrays)
+        if size > self.max_bytes:
+            return value
+
+        with self.lock:
+            if key in self.values:
+                self.nbytes -= self.values.pop(key)[1]
+            self.values[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self.values.popitem(last=False)[1][1]
+
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.values.clear()
+            self.nbytes = 0
+
+    def method(self, f):
+        """
+        Decorator memoizing a method whose result depends only on its
+        arguments, not on the instance. Results are keyed by the module
+        and name of the method, and its arguments, defaults included.
+        Calls with unhashable arguments are not memoized.
+        """
+
+        signature = inspect.signature(f)
+
+        @wraps(f)
+        def memoized(instance, *args, **kwargs):
+            arguments = signature.bind(instance, *args, **kwargs)
+            arguments.apply_defaults()
+            key = (f.__module__, f.__qualname__, *list(arguments.arguments.items())[1:])
+            try:
+                hash(key)
+            except TypeError:
+                return f(instance, *args, **kwargs)
+
+            value = self.get(key)
+            if value is None:
+                value = self.put(key, f(instance, *args, **kwargs))
+            return value
+
+        return memoized
+
+
+def digest(*arrays):
+    """
+    Hash of the contents, shapes and types of a set of arrays.
+
+    :return: str
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(f'{a.dtype.str}{a.shape}'.encode())
+        h.update(a.data)
+    return h.hexdigest()
+
+
+# Mock datasets, shared by all plots
+datasets = cache()
+
+# Integrated streamline trajectories, shared by all plots
+trajectories = cache(max_bytes=2**26)
+
+# Shaded surfaces, shared by all plots
+shadings = cache(max_bytes=2**27)
@@ -6,9 +6,145 @@ Color Maps
 ----------
 """
 
+import difflib
+import threading
+
+import numpy as np
+import matplotlib as mpl
+
+from functools import lru_cache
 
 from matplotlib.colors import LinearSegmentedColormap
 
+from mpl_plotter.cache import digest
+
+
+# Colormap name -> (colormap, lookup table)
+_tables = {}
+_lock   = threading.Lock()
+
+
+def register(cmap):
+    """
+    Resolve a colormap into its lookup table, and cache both under the
+    name of the colormap, replacing any colormap previously cached
+    under it.
+
+    Names of Matplotlib colormaps cannot be taken by other colormaps,
+    so that ``cmap='viridis'`` always refers to Matplotlib's.
+
+    :param cmap: Colormap
+
+    :type cmap:  mpl.colors.Colormap
+
+    :return: cmap
+    """
+    if _shadows(cmap):
+        raise ValueError(f'register: "{cmap.name}" is the name of a Matplotlib colormap, choose another name')
+    return _store(cmap)[0]
+
+
+def _store(cmap):
+    entry = (cmap, _table(cmap))
+    with _lock:
+        _tables[cmap.name] = entry
+    return entry
+
+
+def _table(cmap):
+    table = cmap(np.linspace(0, 1, cmap.N)).astype(np.float32)
+    table.flags.writeable = False
+    return table
+
+
+def _shadows(cmap):
+    # Colormap other than the Matplotlib colormap of the same name
+    return cmap.name in mpl.colormaps and cmap != mpl.colormaps[cmap.name]
+
+
+def lut(cmap):
+    """
+    Lookup table of a colormap: N x 4 float32 array of the RGBA colors of
+    its N levels. Each colormap is resolved once, and its table reused
+    afterwards.
+
+    Colormap names are resolved by Matplotlib, unless a colormap created
+    by ``custom`` or ``mapstack`` is registered under them.
+
+    :param cmap: Colormap, or colormap name
+
+    :type cmap:  str or mpl.colors.Colormap
+
+    :return: np.ndarray
+    """
+    return _resolve(cmap)[1]
+
+
+def _resolve(cmap):
+    name   = cmap if isinstance(cmap, str) else cmap.name
+    cached = _tables.get(name)
+    if cached is not None and (isinstance(cmap, str) or cached[0] is cmap):
+        return cached
+    if isinstance(cmap, str):
+        return _store(mpl.colormaps[cmap])
+    if _shadows(cmap):
+        # Not cached, so that the Matplotlib colormap of the same name is not shadowed
+        return cmap, _table(cmap)
+    return _store(cmap)
+
+
+def colors(values, cmap):
+    """
+    Map values in [0, 1] to the RGBA colors of a colormap, as calling the
+    colormap does, by indexing its lookup table. Values outside of [0, 1]
+    are clipped, and NaNs mapped to the "bad" color of the colormap.
+
+    :param values: Normalized values
+    :param cmap:   Colormap, or colormap name
+
+    :type values:  np.ndarray
+    :type cmap:    str or mpl.colors.Colormap
+
+    :return: float32 array of shape values.shape + (4,)
+    """
+    cmap, table = _resolve(cmap)
+    values      = np.asarray(values, dtype=float)
+    n           = table.shape[0]
+
+    # Level of each value, as truncated by the colormap itself
+    index = values*n
+    np.clip(index, 0, n - 1, out=index)
+    nan = np.isnan(index)
+    bad = nan.any()
+    if bad:
+        index[nan] = 0
+    rgba = table.take(index.astype(np.intp), axis=0)
+
+    if bad:
+        rgba[nan] = mpl.colors.to_rgba(cmap.get_bad())
+    return rgba
+
+
+def closest(name):
+    """
+    Name of the Matplotlib colormap closest to ``name`` (eg: a color, as
+    "red" -> "Reds"), or None if none is close. Searches are cached, for
+    as long as the set of registered colormaps stays the same.
+
+    :param name: Name to match
+
+    :type name:  str
+
+    :return: str
+    """
+    return _closest(name, tuple(mpl.colormaps))
+
+
+@lru_cache(maxsize=256)
+def _closest(name, names):
+    matches = difflib.get_close_matches(name, names)
+    return matches[0] if matches else None
+
 
 def custom(red, green, blue,
            name="coolheat", n=1024):
@@ -24,7 +160,7 @@ def custom(red, green, blue,
         'red': red,
         'green': green,
         'blue': blue}
-    return LinearSegmentedColormap(name, dictionary, n)
+    return register(LinearSegmentedColormap(name, dictionary, n))
 
 
 def mapstack(maps,
@@ -53,9 +189,10 @@ def mapstack(maps,
     if ranges is None:
         ranges = np.tile(np.array([0, 1]), (len(maps), 1))
 
-    stack = tuple(mpl.cm.get_cmap(maps[i])(np.linspace(ranges[i][0], ranges[i][1], int(round(256 * fractions[i], 0))))
+    stack = tuple(mpl.colormaps[maps[i]](np.linspace(ranges[i][0], ranges[i][1], int(round(256 * fractions[i], 0))))
                   for i in range(len(maps)))
 
-    colors = np.vstack(stack)
+    # Named after its colors, so that different stacks are registered apart
+    stack = np.vstack(stack)
 
-    return mpl.colors.LinearSegmentedColormap.from_list('custom_RdBu', colors)
+    return register(mpl.colors.LinearSegmentedColormap.from_list(f'mapstack_{digest(stack)[:12]}', stack))
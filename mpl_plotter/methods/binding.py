@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Argument Binding
+----------------
+"""
+
+import inspect
+
+
+class binder(type):
+    """
+    Plotting class metaclass.
+
+    When a plotting class defining its own ``__init__`` is created, the
+    names of its arguments are read once and used to compile
+    ``<class>._bind(self, args)``, which assigns each argument in ``args``
+    (the ``locals()`` of ``__init__``) to an instance attribute of the
+    same name.
+
+    This way no ``inspect`` or ``eval`` work is done at instantiation time.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+
+        init = namespace.get('__init__')
+
+        if init is not None:
+            namespace['_bind'] = staticmethod(mcs.compile(name, mcs.parameters(init)))
+
+        return super().__new__(mcs, name, bases, namespace)
+
+    @staticmethod
+    def parameters(f):
+        """
+        Names of the keyword-capable arguments of ``f``, excluding ``self``.
+
+        :param f: Function
+
+        :type f: function
+
+        :return: tuple of str
+        """
+        kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        return tuple(p.name for p in list(inspect.signature(f).parameters.values())[1:] if p.kind in kinds)
+
+    @staticmethod
+    def compile(name, params):
+        """
+        Compile a function assigning each of ``params`` from a dictionary
+        of arguments to an instance attribute.
+
+        :param name:   Name of the class the binder is compiled for
+        :param params: Argument names
+
+        :type name:    str
+        :type params:  tuple of str
+
+        :return: function
+        """
+        body   = ''.join(f'\n    self.{p} = args[{p!r}]' for p in params) or '\n    pass'
+        source = f'def _bind(self, args):{body}\n'
+
+        scope = {}
+        exec(compile(source, f'<{name} binder>', 'exec'), scope)
+
+        return scope['_bind']
@@ -47,7 +47,7 @@ def method_background_color(plot):
 
 def method_subplots_adjust(plot):
     
-    plot.plt.subplots_adjust(
+    plot.fig.subplots_adjust(
         top    = plot.top,
         bottom = plot.bottom,
         left   = plot.left,
@@ -57,7 +57,7 @@ def method_subplots_adjust(plot):
 
 def method_save(plot):
     if plot.filename:
-        plot.plt.savefig(plot.filename, dpi=plot.dpi)
+        plot.fig.savefig(plot.filename, dpi=plot.dpi)
 
 def method_show(plot):
     if plot.show is True:
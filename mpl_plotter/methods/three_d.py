@@ -252,11 +252,11 @@ def method_cb(plot):
 
 def method_grid(plot):
     if plot.grid:
-        plot.plt.grid(linestyle=plot.grid_lines, color=plot.grid_color)
+        plot.ax.grid(linestyle=plot.grid_lines, color=plot.grid_color)
     else:
         plot.ax.grid(plot.grid)
     if not plot.show_axes:
-        plot.plt.axis('off')
+        plot.ax.axis('off')
 
 def method_legend(plot):
     if plot.legend is True:
@@ -387,7 +387,7 @@ def method_fonts(plot):
     """
     mpl.rc('font', family=plot.font)
     mpl.rc('font', serif="DejaVu Serif" if plot.font == "serif" else plot.font)
-    plot.plt.rcParams['font.sans-serif'] ="DejaVu Serif" if plot.font == "serif" else plot.font
+    mpl.rcParams['font.sans-serif'] ="DejaVu Serif" if plot.font == "serif" else plot.font
     mpl.rc('font', cursive="Apple Chancery" if plot.font == "serif" else plot.font)
     mpl.rc('font', fantasy="Chicago" if plot.font == "serif" else plot.font)
     mpl.rc('font', monospace="Bitstream Vera Sans Mono" if plot.font == "serif" else plot.font)
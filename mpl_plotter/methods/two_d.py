@@ -371,6 +371,8 @@ def method_tick_labels(plot):
 
     # Date tick labels
     if plot.tick_labels_dates_x:
+        import pandas as pd
+        import datetime as dt
         fmtd = pd.date_range(start=plot.x[0], end=plot.x[-1], periods=plot.tick_number_x)
         fmtd = [dt.datetime.strftime(d, plot.date_format) for d in fmtd]
         plot.ax.set_xticklabels(fmtd)
@@ -386,7 +388,7 @@ def method_fonts(plot):
     """
     mpl.rc('font', family=plot.font)
     mpl.rc('font', serif="DejaVu Serif" if plot.font == "serif" else plot.font)
-    plot.plt.rcParams['font.sans-serif'] = "DejaVu Serif" if plot.font == "serif" else plot.font
+    mpl.rcParams['font.sans-serif'] = "DejaVu Serif" if plot.font == "serif" else plot.font
     mpl.rc('font', cursive="Apple Chancery" if plot.font == "serif" else plot.font)
     mpl.rc('font', fantasy="Chicago" if plot.font == "serif" else plot.font)
     mpl.rc('font', monospace="Bitstream Vera Sans Mono" if plot.font == "serif" else plot.font)
@@ -8,7 +8,6 @@ Preset
 
 import os
 import sys
-import toml
 import inspect
 from pathlib import Path
 from importlib import util
@@ -65,6 +64,8 @@ class preset:
             if v is None:
                 _dict[k] = 'None'
 
+        import toml
+
         dump  = toml.dumps(_dict)
         lines = dump.split('\n')[:-1]
         klen  = max([len(key) for key in _dict.keys()]) + 1
@@ -91,6 +92,8 @@ class preset:
         """
         Load MPL Plotter preset from TOML file
         """
+        import toml
+
         with open(file, 'r') as f:
             _dict = toml.load(f)['MPL PLOTTER PRESET']
         
@@ -0,0 +1,392 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Headless Rendering
+------------------
+"""
+
+import io
+import os
+import pickle
+import traceback
+
+from collections import OrderedDict
+
+
+def agg_figure(figsize=None):
+    """
+    Create a standalone figure with an Agg canvas, without Pyplot.
+    Matplotlib's figure module is imported on first use, to keep it
+    out of ``import mpl_plotter``.
+
+    :param figsize: Matplotlib figure size. Default: rcParams["figure.figsize"]
+
+    :type figsize: tuple
+
+    :return: Figure object
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+
+    return fig
+
+
+def layout(fig):
+    """
+    Lay out a figure in memory: run a draw pass over it without
+    producing any output, so that the placement of artists resolved at
+    draw time (eg: legends) is the same as when saving the figure.
+
+    :param fig: Figure object
+    """
+    if hasattr(fig, 'draw_without_rendering'):
+        fig.draw_without_rendering()
+    else:
+        # Matplotlib < 3.6
+        from matplotlib.backends.backend_agg import RendererAgg
+        fig.draw(RendererAgg(*fig.bbox.size, fig.dpi))
+
+
+class figure_pool:
+    """
+    Pool of standalone figures with Agg canvases and a single axes,
+    for repeated renders with the same layout.
+
+    Figures are keyed by ``figsize``, ``shape_and_position`` and axes
+    projection. Once released, a figure is reset and kept idle until
+    acquired for the same layout, so that the figure, canvas and axes
+    are built only once. Up to ``size`` idle figures are kept, evicting
+    the least recently used ones when full.
+
+    On release, the following are reset:
+
+    - Data artists, legends, figure texts and axes added during use (eg: color bars)
+    - Axes title and labels, axis label positions, limits, aspect ratio, grid,
+      property cycle, ticks, axis and spine visibility
+
+    Any other axes settings are left to the plotting pipeline, which applies
+    them on every use.
+
+    :param size: Maximum number of idle figures
+
+    :type size: int
+    """
+
+    def __init__(self, size=16):
+        self.size = size
+        self.idle = OrderedDict()       # layout -> list of (fig, ax, subplotspec, spine visibility, axis labels)
+        self.busy = {}                  # fig -> (layout, ax, subplotspec, spine visibility, axis labels)
+
+    def __len__(self):
+        return sum(len(figures) for figures in self.idle.values())
+
+    def acquire(self, figsize=None, shape_and_position=111, projection=None):
+        """
+        Get an idle figure with the given layout, or build a new one.
+
+        :return: Figure and axes
+        """
+
+        layout = (None if figsize is None else tuple(figsize), shape_and_position, projection)
+
+        if self.idle.get(layout):
+            fig, *state = self.idle[layout].pop()
+            self.idle.move_to_end(layout)
+        else:
+            fig = agg_figure(figsize)
+            ax  = fig.add_subplot(shape_and_position, projection=projection)
+            state = [ax, ax.get_subplotspec(), {k: spine.get_visible() for k, spine in ax.spines.items()},
+                     # Axis label position, transform and automatic placement, modified by set_label_coords
+                     {axis: (axis.label.get_position(), axis.label.get_transform(), axis._autolabelpos)
+                      for axis in (ax.xaxis, ax.yaxis)}]
+
+        self.busy[fig] = (layout, *state)
+
+        return fig, state[0]
+
+    def release(self, fig):
+        """
+        Reset a figure obtained with ``acquire`` and return it to the pool,
+        evicting the least recently used idle figure if the pool is full.
+        """
+
+        layout, ax, subplotspec, spines, labels = self.busy.pop(fig)
+
+        self.reset(fig, ax, subplotspec, spines, labels)
+
+        self.idle.setdefault(layout, []).append((fig, ax, subplotspec, spines, labels))
+        self.idle.move_to_end(layout)
+
+        while len(self) > self.size:
+            lru = next(iter(self.idle))
+            self.idle[lru].pop(0)
+            if not self.idle[lru]:
+                del self.idle[lru]
+
+    @staticmethod
+    def reset(fig, ax, subplotspec, spines, labels):
+
+        # Figure: axes added during use, legends and texts
+        for _ax in fig.axes:
+            if _ax is not ax:
+                _ax.remove()
+        fig.legends.clear()
+        fig.texts.clear()
+
+        # Restore the layout of the axes, modified by color bars
+        if subplotspec is not None:
+            ax.set_subplotspec(subplotspec)
+        ax.set_anchor('C')
+
+        # Data artists
+        for artist in (*ax.lines, *ax.collections, *ax.images, *ax.patches, *ax.texts, *ax.artists, *ax.tables):
+            artist.remove()
+        if ax.legend_ is not None:
+            ax.legend_.remove()
+        ax.containers.clear()
+
+        # Axes state
+        for loc in ('center', 'left', 'right'):
+            ax.set_title('', loc=loc)
+        ax.set_xlabel('')
+        ax.set_ylabel('')
+        ax.relim()
+        ax.set_autoscale_on(True)
+        ax.set_aspect('auto')
+        ax.grid(False)
+        ax.set_prop_cycle(None)
+        ax.tick_params(axis='both', rotation=0)
+        ax.xaxis.reset_ticks()
+        ax.yaxis.reset_ticks()
+        ax.set_axis_on()
+        for k, visible in spines.items():
+            ax.spines[k].set_visible(visible)
+        for axis, (position, transform, auto) in labels.items():
+            axis.label.set_position(position)
+            axis.label.set_transform(transform)
+            axis._autolabelpos = auto
+
+
+def render(plotter, kwargs, fmt='png', dpi=None, pool=None):
+    """
+    Render a single plot on a standalone figure with an Agg canvas,
+    without Pyplot.
+
+    :param plotter: MPL Plotter plotting class
+    :param kwargs:  Plotting class keyword arguments
+    :param fmt:     Output format if no ``filename`` is given in ``kwargs``
+    :param dpi:     Output resolution if no ``dpi`` is given in ``kwargs``
+    :param pool:    Figure pool from which to take the figure and axes
+
+    :type plotter:  type
+    :type kwargs:   dict
+    :type fmt:      str
+    :type dpi:      float
+    :type pool:     figure_pool
+
+    :return: ``filename`` if given in ``kwargs``, otherwise the rendered figure as bytes
+    """
+
+    kwargs = {**kwargs, 'backend': None, 'show': False}
+
+    assert kwargs.get('fig') is None and kwargs.get('ax') is None, \
+        'render: figures and axes are created by the renderer, do not pass ``fig`` or ``ax``'
+
+    if pool is not None:
+        from mpl_plotter.three_d.plotters import plot as plot3
+        fig, ax = pool.acquire(kwargs.get('figsize'),
+                               kwargs.get('shape_and_position', 111),
+                               '3d' if issubclass(plotter, plot3) else None)
+        kwargs['ax'] = ax
+    else:
+        fig = agg_figure(kwargs.get('figsize'))
+
+    kwargs['fig'] = fig
+    kwargs['dpi'] = kwargs.get('dpi', dpi)
+
+    try:
+        # main() and finish(), saving to kwargs['filename'] if given
+        plotter(**kwargs)
+
+        if kwargs.get('filename'):
+            return kwargs['filename']
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=kwargs['dpi'])
+
+        return buffer.getvalue()
+
+    finally:
+        if pool is not None:
+            pool.release(fig)
+
+
+def render_batch(specs, fmt='png', dpi=None, pool=None):
+    """
+    Render a batch of plots, each on its own standalone figure with an
+    Agg canvas. Pyplot is never imported, nor any figure registered in
+    its global figure manager, so that arbitrarily many figures can be
+    produced in a single process.
+
+    Each spec is a ``(plotter, kwargs)`` pair, where ``plotter`` is an
+    MPL Plotter plotting class (eg: ``mpl_plotter.two_d.line``) and
+    ``kwargs`` its keyword arguments. ``backend`` and ``show`` are
+    overridden, and ``fig`` and ``ax`` must not be passed.
+
+    :param specs: Plot specifications
+    :param fmt:   Output format of plots without a ``filename``
+    :param dpi:   Output resolution of plots without a ``dpi``
+    :param pool:  Figure pool from which to take figures and axes, reused across plots with the same layout
+
+    :type specs:  list of tuple
+    :type fmt:    str
+    :type dpi:    float
+    :type pool:   figure_pool
+
+    :return: List containing, for each spec, its ``filename`` if given, or the rendered figure as bytes
+    """
+    return [render(plotter, kwargs, fmt=fmt, dpi=dpi, pool=pool) for plotter, kwargs in specs]
+
+
+class RenderError(Exception):
+    """
+    Failure to render a single spec of a parallel batch.
+
+    :param index:     Position of the spec in the batch
+    :param traceback: Formatted traceback of the exception raised in the worker
+    """
+
+    def __init__(self, index, traceback):
+        super().__init__(index, traceback)
+        self.index     = index
+        self.traceback = traceback
+
+    def __str__(self):
+        return f'spec {self.index} failed to render:\n{self.traceback}'
+
+
+_worker_pool = None
+
+
+def _init_worker(pool_size):
+    """
+    Worker initializer: set the non-interactive Agg backend and import
+    Matplotlib and MPL Plotter once per worker process, and create the
+    figure pool of the worker if a ``pool_size`` is given.
+    """
+    global _worker_pool
+    _worker_pool = figure_pool(pool_size) if pool_size else None
+
+    import matplotlib as mpl
+    mpl.use('Agg')
+
+    import mpl_plotter.two_d
+    import mpl_plotter.three_d
+
+
+def _render_worker(job):
+    """
+    Render a single spec in a worker process, returning the exception
+    traceback instead of raising it.
+    """
+    plotter, kwargs, fmt, dpi = job
+    try:
+        return True, render(plotter, kwargs, fmt=fmt, dpi=dpi, pool=_worker_pool)
+    except Exception:
+        return False, traceback.format_exc()
+
+
+def _render_chunk(jobs):
+    return [_render_worker(job) for job in jobs]
+
+
+def _dispatch(jobs, indices, results, workers, chunksize, mp_context, pool_size):
+    """
+    Render the specs at ``indices`` over a pool of worker processes,
+    ``chunksize`` specs at a time, storing their results in ``results``.
+
+    :return: Indices of the specs lost to a worker process terminating abruptly
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    chunks = [indices[a:a + chunksize] for a in range(0, len(indices), chunksize)]
+    lost   = []
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=mp_context,
+                             initializer=_init_worker, initargs=(pool_size,)) as executor:
+        futures = [(chunk, executor.submit(_render_chunk, [jobs[i] for i in chunk])) for chunk in chunks]
+        for chunk, future in futures:
+            try:
+                for i, result in zip(chunk, future.result()):
+                    results[i] = result
+            except BrokenProcessPool:
+                lost += chunk
+
+    return lost
+
+
+def render_parallel(specs, workers=None, fmt='png', dpi=None, chunksize=None, mp_context=None, pool_size=None):
+    """
+    Render a batch of plots in parallel, over a pool of worker processes
+    using the Agg backend. Each plot is rendered as in ``render_batch``.
+
+    Results are returned in the order in which the specs are given. A
+    spec failing to render does not abort the batch: its result is a
+    ``RenderError`` containing its index and the worker traceback. This
+    includes specs which cannot be pickled, and specs terminating their
+    worker process, which are told apart from the rest of their chunk by
+    rendering the specs of the chunk again one by one.
+
+    :param specs:      Plot specifications: ``(plotter, kwargs)`` pairs (see ``render_batch``)
+    :param workers:    Number of worker processes. Default: number of CPUs
+    :param fmt:        Output format of plots without a ``filename``
+    :param dpi:        Output resolution of plots without a ``dpi``
+    :param chunksize:  Number of specs sent to a worker at a time. Default: a quarter of the specs per worker
+    :param mp_context: Multiprocessing context for the worker processes
+    :param pool_size:  Size of the figure pool of each worker. Default: no pooling
+
+    :type specs:       list of tuple
+    :type workers:     int
+    :type fmt:         str
+    :type dpi:         float
+    :type chunksize:   int
+    :type mp_context:  multiprocessing.context.BaseContext
+    :type pool_size:   int
+
+    :return: List containing, for each spec, its ``filename`` if given, the rendered figure as bytes, or a ``RenderError``
+    """
+
+    specs   = list(specs)
+    workers = os.cpu_count() if workers is None else workers
+
+    if not specs:
+        return []
+
+    if chunksize is None:
+        chunksize = max(1, len(specs) // (4 * workers))
+
+    jobs    = [(plotter, kwargs, fmt, dpi) for plotter, kwargs in specs]
+    results = [None]*len(jobs)
+
+    # Specs which cannot be sent to the workers
+    indices = []
+    for i, job in enumerate(jobs):
+        try:
+            pickle.dumps(job)
+            indices.append(i)
+        except Exception:
+            results[i] = (False, traceback.format_exc())
+
+    lost = _dispatch(jobs, indices, results, workers, chunksize, mp_context, pool_size) if indices else []
+
+    # Chunks lost to a worker terminating abruptly, one spec at a time
+    for i in lost:
+        if _dispatch(jobs, [i], results, 1, 1, mp_context, pool_size):
+            results[i] = (False, 'The worker process rendering the spec terminated abruptly')
+
+    return [result if ok else RenderError(i, result) for i, (ok, result) in enumerate(results)]
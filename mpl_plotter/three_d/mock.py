@@ -9,6 +9,8 @@ Placeholders
 import numpy as np
 from matplotlib import cbook
 
+from mpl_plotter.cache import datasets
+
 
 class MockData:
 
@@ -35,6 +37,7 @@ class MockData:
 
         return x, y, z
 
+    @datasets.method
     def hill(self):
         with cbook.get_sample_data('jacksboro_fault_dem.npz', np_load=True) as dem:
             z = dem['elevation']
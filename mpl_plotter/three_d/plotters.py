@@ -6,15 +6,10 @@ Plotting Methods
 ----------------
 """
 
-import inspect
-import difflib
 import warnings
 import numpy as np
 import matplotlib as mpl
 
-from matplotlib import cm
-from matplotlib.colors import LightSource
-
 from importlib import import_module
 
 # METHODS
@@ -23,22 +18,36 @@ from mpl_plotter.three_d.components import guides
 from mpl_plotter.three_d.components import framing
 from mpl_plotter.three_d.components import text
 
+from mpl_plotter.methods.binding import binder
+from mpl_plotter.timing import stages
+
+from mpl_plotter.color.maps import colors, closest
 from mpl_plotter.three_d.mock import MockData
+from mpl_plotter.three_d.shading import shade
+
+from mpl_plotter.utils import ensure_ndarray
 
 
-class plot(canvas, guides, framing, text):
+class plot(canvas, guides, framing, text, metaclass=binder):
+
+    @property
+    def plt(self):
+        """
+        Pyplot, imported on first use. Plots drawn on a given
+        ``fig`` with ``show=False`` never import it.
+        """
+        return import_module("matplotlib.pyplot")
 
     def init(self):
 
         self.method_backend()
 
-        self.plt = import_module("matplotlib.pyplot")
-
         self.run()
 
     def run(self):
-        self.main()
-        self.finish()
+        with stages(self):
+            self.main()
+            self.finish()
 
     def main(self):
         # Canvas setup
@@ -181,8 +190,7 @@ class line(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(line).parameters:
-            setattr(self, item, eval(item))
+        line._bind(self, locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -316,8 +324,7 @@ class scatter(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(scatter).parameters:
-            setattr(self, item, eval(item))
+        scatter._bind(self, locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -353,8 +360,9 @@ class surface(plot):
     def __init__(self,
                  # Specifics
                  x=None, y=None, z=None, surface_rstride=1, surface_cstride=1, surface_wire_width=0.1,
+                 surface_faces=None,
                  surface_lighting=False, surface_antialiased=False, surface_shade=False, surface_alpha=1,
-                 surface_cmap_lighting=None, surface_norm=None,
+                 surface_cmap_lighting=None, surface_lighting_dtype='float32', surface_norm=None,
                  surface_edge_color='black', surface_edges_to_rgba=False,
                  # Specifics: color
                  cmap='RdBu_r', color=None, color_rule=None,
@@ -449,6 +457,8 @@ class surface(plot):
         :param z: z
         :param surface_rstride: Surface grid definition
         :param surface_cstride: Surface grid definition
+        :param surface_faces: Face budget. Grids with more faces are resampled, with the smallest
+                              strides (no smaller than surface_rstride and surface_cstride) within it
         :param line_width: Width of interpolating lines
 
         - Lighting
@@ -464,6 +474,7 @@ class surface(plot):
         :param alpha: Transparency
         :param cmap: Colormap
         :param surface_cmap_lighting: Colormap used for lighting
+        :param surface_lighting_dtype: Floating point precision of the lighting computation
 
         Other
         :param backend: Interactive plotting backends. Working with Python 3.7.6: Qt5Agg, QT4Agg, TkAgg.
@@ -477,8 +488,7 @@ class surface(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(surface).parameters:
-            setattr(self, item, eval(item))
+        surface._bind(self, locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -488,31 +498,35 @@ class surface(plot):
         self.init()
 
     def plot(self):
+        # Face budget
+        if self.surface_faces is not None:
+            self.resample()
+
         if self.surface_lighting:
             # Lightning
             self.graph = self.ax.plot_surface(self.x, self.y, self.z,
                                               alpha=self.surface_alpha,
                                               cmap=self.cmap if self.color is None else None,
                                               norm=self.surface_norm, color=self.color,
-                                              edgecolors=self.surface_edge_color,
                                               facecolors=self.method_lighting(),
                                               rstride=self.surface_rstride, cstride=self.surface_cstride, linewidth=self.surface_wire_width,
-                                              surface_antialiased=self.surface_antialiased, shade=self.surface_shade,
+                                              antialiased=self.surface_antialiased, shade=self.surface_shade,
                                               )
+            # Edges are colored after the fact, as Matplotlib sets them to the face colors
+            self.graph.set_edgecolor(self.surface_edge_color)
         elif self.color_rule is not None:
             # Colormap
-            cmap = mpl.cm.get_cmap(self.cmap) if not isinstance(self.cmap, mpl.colors.LinearSegmentedColormap) else self.cmap
-            surface_facecolors = cmap((self.color_rule + abs(self.color_rule.min()))/(self.color_rule.max() + abs(self.color_rule.min())))
+            surface_facecolors = colors((self.color_rule + abs(self.color_rule.min()))/(self.color_rule.max() + abs(self.color_rule.min())), self.cmap)
 
             self.graph = self.ax.plot_surface(self.x, self.y, self.z,
                                               alpha=self.surface_alpha,
                                               cmap=self.cmap,
                                               norm=self.surface_norm,
                                               facecolors=surface_facecolors,
-                                              edgecolors=self.surface_edge_color,
                                               rstride=self.surface_rstride, cstride=self.surface_cstride, linewidth=self.surface_wire_width,
                                               antialiased=self.surface_antialiased, shade=self.surface_shade,
                                               )
+            self.graph.set_edgecolor(self.surface_edge_color)
         elif self.surface_norm is not None:
             self.graph = self.ax.plot_surface(self.x, self.y, self.z,
                                               alpha=self.surface_alpha,
@@ -540,43 +554,70 @@ class surface(plot):
             self.x, self.y, self.z = MockData().hill()
             self.surface_norm = mpl.colors.Normalize(vmin=self.z.min(), vmax=self.z.max())
 
+    def strides(self, rows, columns):
+        """
+        Smallest row and column strides, no smaller than ``surface_rstride``
+        and ``surface_cstride``, with which a grid of the given shape is drawn
+        with at most ``surface_faces`` faces.
+
+        :return: tuple
+        """
+        faces   = lambda r, c: -(-(rows - 1)//r)*-(-(columns - 1)//c)
+        r, c    = max(1, self.surface_rstride), max(1, self.surface_cstride)
+        budget  = max(1, self.surface_faces)
+
+        # Start from a uniform reduction, then coarsen the direction with most faces
+        factor  = np.sqrt(faces(r, c)/budget)
+        if factor > 1:
+            r, c = int(r*factor), int(c*factor)
+        while faces(r, c) > budget:
+            if -(-(rows - 1)//r) >= -(-(columns - 1)//c):
+                r += 1
+            else:
+                c += 1
+        return r, c
+
+    def resample(self):
+        """
+        Resample the grid, and the color rule, with the strides within the
+        face budget, keeping its last row and column. Each face of the
+        resampled grid is a single quadrilateral, instead of the perimeter
+        of the strided cells Matplotlib draws otherwise.
+        """
+        x, y, z = np.broadcast_arrays(self.x, self.y, self.z)
+        rows, columns = z.shape
+        r, c = self.strides(rows, columns)
+        if (r, c) == (1, 1):
+            return
+
+        i = np.r_[0:rows - 1:r, rows - 1]
+        j = np.r_[0:columns - 1:c, columns - 1]
+        self.x, self.y, self.z = x[np.ix_(i, j)], y[np.ix_(i, j)], z[np.ix_(i, j)]
+        if isinstance(self.color_rule, np.ndarray) and self.color_rule.shape[:2] == (rows, columns):
+            self.color_rule = self.color_rule[np.ix_(i, j)]
+
+        self.surface_rstride = self.surface_cstride = 1
+
     def method_lighting(self):
-        ls = LightSource(270, 45)
-
-        if self.color is not None:
-            if self.surface_cmap_lighting is None:
-                try:
-                    cmap = difflib.get_close_matches(self.color, self.plt.colormaps())[0]
-                    print_color(
-                        f'You have selected the solid _color_ "{self.color}" for your surface, and set _lighting_ as True\n\n'
-                        f'   The search for Matplotlib colormaps similar to "{self.color}" has resulted in: \n',
-                        "blue")
-                    print(f'       "{cmap}"\n')
-                    print_color(
-                        '   Specify a custom colormap for the lighting function with the _surface_cmap_lighting_ attribute.\n'
-                        '   NOTE: This will overrule your monochrome color, however. Set _lighting_ to False if this is undesired.',
-                        "blue")
-                except IndexError:
-                    cmap = "Greys"
-                    print_color(
-                        f'You have selected the solid _color_ "{self.color}" for your surface, and set _lighting_ as True\n\n'
-                        f'   The search for Matplotlib colormaps similar to "{self.color}" has failed. Reverting to\n',
-                        "red")
-                    print(f'       "{cmap}"\n')
-                    print_color(
-                        '   Specify a custom colormap for the lighting function with the _surface_cmap_lighting_ attribute.\n'
-                        '   NOTE: This will overrule your monochrome color, however. Set _lighting_ to False if this is undesired.',
-                        "red")
+        if self.surface_cmap_lighting is not None:
+            cmap = self.surface_cmap_lighting
+        elif self.color is not None:
+            cmap = closest(self.color)
+            if cmap is not None:
+                warnings.warn(f'You have selected the solid _color_ "{self.color}" for your surface, and set _lighting_ as True. '
+                              f'The search for Matplotlib colormaps similar to "{self.color}" has resulted in "{cmap}". '
+                              'Specify a custom colormap for the lighting function with the _surface_cmap_lighting_ attribute. '
+                              'NOTE: This will overrule your monochrome color, however. Set _lighting_ to False if this is undesired.')
             else:
-                cmap = self.surface_cmap_lighting
+                cmap = "Greys"
+                warnings.warn(f'You have selected the solid _color_ "{self.color}" for your surface, and set _lighting_ as True. '
+                              f'The search for Matplotlib colormaps similar to "{self.color}" has failed. Reverting to "{cmap}". '
+                              'Specify a custom colormap for the lighting function with the _surface_cmap_lighting_ attribute. '
+                              'NOTE: This will overrule your monochrome color, however. Set _lighting_ to False if this is undesired.')
         else:
-            cmap = self.surface_cmap_lighting if self.surface_cmap_lighting is not None else self.cmap
-
-        rgb = ls.surface_shade(self.z,
-                       cmap=cm.get_cmap(cmap),
-                       vert_exag=0.1, blend_mode='soft')
+            cmap = self.cmap
 
-        return rgb
+        return shade(self.z, cmap, azdeg=270, altdeg=45, vert_exag=0.1, dtype=self.surface_lighting_dtype)
 
     def method_edges_to_rgba(self):
         if self.surface_edges_to_rgba is True:
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Shading
+-------
+"""
+
+import numpy as np
+
+from mpl_plotter.cache import digest, shadings
+from mpl_plotter.color.maps import colors, lut
+
+
+def shade(z, cmap, azdeg=270, altdeg=45, vert_exag=0.1, dtype='float32'):
+    """
+    Color an elevation grid with a colormap, and shade it with a light
+    source, as ``LightSource(azdeg, altdeg).shade(z, cmap, vert_exag=vert_exag,
+    blend_mode='soft')`` does, computed with ``dtype`` precision.
+
+    Results are cached by the contents of ``z`` and of the lookup table of
+    ``cmap``, and the light parameters, so that the same surface is shaded
+    once however many times it is drawn.
+
+    :param z:         Elevation grid
+    :param cmap:      Colormap, or colormap name
+    :param azdeg:     Azimuth of the light source, clockwise from North [deg]
+    :param altdeg:    Altitude of the light source, up from the horizon [deg]
+    :param vert_exag: Vertical exaggeration of the elevation
+    :param dtype:     Floating point precision of the computation
+
+    :type z:          np.ndarray
+    :type cmap:       str or mpl.colors.Colormap
+    :type azdeg:      float
+    :type altdeg:     float
+    :type vert_exag:  float
+    :type dtype:      str or np.dtype
+
+    :return: Read-only array of shape z.shape + (4,) of RGBA colors
+    """
+
+    dtype  = np.dtype(dtype)
+    key    = (digest(z, lut(cmap)), azdeg, altdeg, vert_exag, dtype.str)
+    cached = shadings.get(key)
+    if cached is not None:
+        return cached
+
+    z = np.asarray(z, dtype=dtype)
+
+    # Unit vector towards the light source
+    az, alt   = np.radians(90 - azdeg), np.radians(altdeg)
+    direction = np.array([np.cos(az)*np.cos(alt), np.sin(az)*np.cos(alt), np.sin(alt)], dtype=dtype)
+
+    # Illumination: normal of the surface (first row on top, as in images) dotted with the light direction
+    e_dy, e_dx = np.gradient(dtype.type(vert_exag)*z, -1, 1)
+    intensity  = (direction[2] - e_dx*direction[0] - e_dy*direction[1])/np.sqrt(e_dx**2 + e_dy**2 + 1)
+
+    # Rescaled to [0, 1], unless the slope is constant
+    low, high = np.nanmin(intensity), np.nanmax(intensity)
+    if high - low > 1e-6:
+        intensity = (intensity - low)/(high - low)
+    intensity = np.clip(intensity, 0, 1)[..., np.newaxis]
+
+    # Soft light blend of the colormap colors
+    low, high = np.nanmin(z), np.nanmax(z)
+    rgba = colors((z - low)/((high - low) or 1), cmap).astype(dtype, copy=False)
+    rgb  = rgba[..., :3]
+    rgba[..., :3] = 2*intensity*rgb + (1 - 2*intensity)*rgb**2
+
+    return shadings.put(key, rgba)
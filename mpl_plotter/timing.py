@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Pipeline Timing
+---------------
+"""
+
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# Active timers, per thread and task
+_timers = ContextVar('timers', default=())
+
+# Plotting class -> names of its pipeline stages
+_stages = {}
+
+
+class timer:
+    """
+    Record the duration of each stage of the plotting pipeline
+    (``method_fonts``, ``method_setup``, ..., ``mock``, ``plot``,
+    ..., ``method_save``) of all plots drawn within its context.
+
+    Stages called from within another stage (eg: ``method_resize_axes``
+    called by ``heatmap.plot``) count towards the duration of the
+    outermost stage.
+
+    .. code-block:: python
+
+        with timer() as t:
+            line(...)
+            heatmap(...)
+
+        print(t.report())
+
+    :param callback: Function called with ``(plot, stage, duration)`` after each stage
+
+    :type callback: function
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.records  = []          # [(plotting class name, {stage: duration [s]}), ...]
+        self.tokens   = []          # Context variable tokens, one per active ``with`` block
+
+    def __enter__(self):
+        self.tokens.append(_timers.set(_timers.get() + (self,)))
+        return self
+
+    def __exit__(self, *exc):
+        _timers.reset(self.tokens.pop())
+
+    def stats(self):
+        """
+        Aggregate statistics of each stage across all recorded plots.
+
+        :return: Dictionary of stages, each with its ``count``, ``total``, ``mean``, ``min`` and ``max`` duration [s]
+        """
+        durations = {}
+        for _, record in self.records:
+            for stage, duration in record.items():
+                durations.setdefault(stage, []).append(duration)
+
+        return {stage: {'count': len(d),
+                        'total': sum(d),
+                        'mean':  sum(d)/len(d),
+                        'min':   min(d),
+                        'max':   max(d)}
+                for stage, d in durations.items()}
+
+    def report(self):
+        """
+        Table of the aggregate statistics of each stage, sorted by total duration.
+
+        :return: str
+        """
+        stats = sorted(self.stats().items(), key=lambda item: item[1]['total'], reverse=True)
+        total = sum(s['total'] for _, s in stats) or 1
+
+        lines = [f'{"stage":<28}{"count":>7}{"total [ms]":>12}{"mean [ms]":>11}{"max [ms]":>10}{"share":>8}']
+        for stage, s in stats:
+            lines.append(f'{stage:<28}{s["count"]:>7}{s["total"]*1e3:>12.2f}{s["mean"]*1e3:>11.2f}'
+                         f'{s["max"]*1e3:>10.2f}{s["total"]/total:>8.1%}')
+
+        return '\n'.join(lines)
+
+
+def stage_names(cls):
+    """
+    Names of the pipeline stages of a plotting class.
+
+    :type cls: type
+
+    :return: tuple of str
+    """
+    if cls not in _stages:
+        _stages[cls] = tuple(name for name in dir(cls)
+                             if (name.startswith('method_') and name != 'method_backend') or name in ['mock', 'plot', 'update_graph'])
+    return _stages[cls]
+
+
+@contextmanager
+def stages(plot):
+    """
+    Time the pipeline stages run by ``plot`` within this context, if any
+    ``timer`` is active. Otherwise, do nothing.
+
+    :param plot: Plotting class instance
+    """
+
+    timers = _timers.get()
+    if not timers:
+        yield
+        return
+
+    record = {}
+    depth  = [0]
+
+    def timed(stage, method):
+        def wrapper(*args, **kwargs):
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+                if depth[0] == 0:
+                    duration = time.perf_counter() - start
+                    record[stage] = record.get(stage, 0) + duration
+                    for t in timers:
+                        if t.callback is not None:
+                            t.callback(plot, stage, duration)
+        return wrapper
+
+    # Shadow the stages of the instance with timed versions
+    names = stage_names(type(plot))
+    for stage in names:
+        setattr(plot, stage, timed(stage, getattr(plot, stage)))
+
+    try:
+        yield
+    finally:
+        for stage in names:
+            delattr(plot, stage)
+        for t in timers:
+            t.records.append((type(plot).__name__, record))
@@ -6,6 +6,8 @@
 --
 """
 
-from mpl_plotter.two_d.plotters import line, scatter, heatmap, quiver, streamline, fill_area
+from mpl_plotter.two_d.plotters import line, scatter, heatmap, quiver, streamline, fill_area, deferred
 from mpl_plotter.two_d.comparison import comparison
 from mpl_plotter.two_d.panes import panes
+from mpl_plotter.two_d.spec import plot_spec
+from mpl_plotter.two_d.streaming import stream
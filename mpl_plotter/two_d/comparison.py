@@ -6,16 +6,16 @@ Composition: ``comparison``
 ---------------------------
 """
 
-import inspect
+from contextlib import nullcontext
 
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 
 from mpl_plotter.two_d import line
+from mpl_plotter.two_d.plotters import deferred as deferring
+from mpl_plotter.two_d.spec import classify, singular
 from mpl_plotter.color.schemes import colorscheme_one
 
-from mpl_plotter.utils import home
+from mpl_plotter.render import layout
 
 
 def comparison(x,
@@ -29,6 +29,9 @@ def comparison(x,
                right=None,
                wspace=None,
                hspace=None,
+               deferred=False,
+               collection=False,
+               spec=None,
                **kwargs):
     """
     .. raw:: latex
@@ -110,6 +113,12 @@ def comparison(x,
     :param right:     plt.subplots_adjust parameter
     :param wspace:    plt.subplots_adjust parameter
     :param hspace:    plt.subplots_adjust parameter
+    :param deferred:  Draw all curves first, and finish the plot (axis resizing, framing, ticks,
+                      legend, save...) only once, with the last curve
+    :param collection: Draw all curves as a single line collection, with a single plot. Curves
+                       may only be lines, and only colors, line widths and labels can be set
+                       per curve
+    :param spec:       Compiled keyword arguments (see ``plot_spec``), to which ``kwargs`` are added
     :param kwargs:    MPL Plotter plotting class keyword arguments for further customization
  
     :type x:          list of list or list of np.ndarray
@@ -123,13 +132,20 @@ def comparison(x,
     :type right:      float
     :type wspace:     float
     :type hspace:     float
+    :type deferred:   bool
+    :type collection: bool
+    :type spec:       mpl_plotter.two_d.spec.plot_spec
     """
 
+    # Pyplot is imported on use, so that importing MPL Plotter does not import it
+    import matplotlib.pyplot as plt
+
     ###############################
     #       INPUT VALIDATION      #
     ###############################
-    single_x = (isinstance(x, list) and len(x) == 1) or isinstance(x, np.ndarray)
-    single_y = (isinstance(y, list) and len(y) == 1) or isinstance(y, np.ndarray)
+    # 2D arrays hold a curve per row
+    single_x = (isinstance(x, list) and len(x) == 1) or (isinstance(x, np.ndarray) and x.ndim < 2)
+    single_y = (isinstance(y, list) and len(y) == 1) or (isinstance(y, np.ndarray) and y.ndim < 2)
 
     x = np.array(x).squeeze() if single_x else x
     y = np.array(y).squeeze() if single_y else y
@@ -150,27 +166,8 @@ def comparison(x,
     ###############################
     #          ARGUMENTS          #
     ###############################
-    # figure ----------------------------------------------------------
-    fig_par = [                                                         # Get figure specific parameters
-                'backend',
-                'show',
-                'legend',
-                'legend_loc',
-                'resize_axes',
-                'grid'
-              ]
-    fargs = list(set(fig_par) & set(list(kwargs.keys())))             # Intersection of kwarg keys and fig args
-    fargs = {k: kwargs.pop(k) for k in fargs}                       # Dictionary of figure parameters
-
-    # plural ----------------------------------------------------------
-    args    = line.__init__.__code__.co_varnames                        # Get line function arguments
-
-    ax_arg = lambda arg: arg[-2:] in ['_x', '_y']
-
-    plurals = [arg + 's' if not ax_arg(arg) else arg[:-2] + 's' + arg[-2:] for arg in args]
-
-    plurals = list(set(plurals) & set(kwargs.keys()))                   # Intersection of kwargs keys and plurals
-    plurals = {k: kwargs.pop(k) for k in plurals}                       # Dictionary of plurals
+    # Figure, plural and curve arguments, classified once if compiled into a spec
+    fargs, plurals, cargs, kwargs = spec.classified(kwargs) if spec is not None else classify('comparison', kwargs)
 
     def plural(i):
         """
@@ -182,20 +179,10 @@ def comparison(x,
         _args = {}
 
         for k in plurals.keys():
-            _k = k[:-3] + k[-2:] if ax_arg(k) else k[:-1]
-            _args[_k] = plurals[k][i]
+            _args[singular(k)] = plurals[k][i]
 
         return _args
 
-    # curve -----------------------------------------------------------
-    crv_par = [                                                       # Get curve specific parameters
-                'color',
-                'line_width',
-                'plot_label'
-              ]
-    cargs = list(set(crv_par) & set(list(kwargs.keys())))             # Intersection of kwarg keys and fig args
-    cargs = {k: kwargs.pop(k) for k in cargs}                         # Dictionary of figure parameters
-
     def cparam(i):
         """
         Get curve parameters of the ith curve.
@@ -246,25 +233,47 @@ def comparison(x,
     ###############################
     #            PLOT             #
     ###############################
-    for n in range(n_curves):
-
-        args = {**kwargs, **plural(n), **cparam(n)} if n != n_curves - 1 else {**kwargs, **plural(n), **cparam(n), **fargs}
+    if collection:
+        # All curves drawn by a single line plot, as a single collection
+        assert all(g is line for g in f), ValueError('comparison: only lines can be drawn as a collection')
+        assert set(plurals) <= {'colors', 'line_widths', 'plot_labels'}, \
+            ValueError('comparison: only colors, line_widths and plot_labels can be set per curve when drawing curves as a collection')
 
-        f[n](x=x[n] if not single_x else x,
-             y=y[n] if not single_y else y,
+        line(x=x if single_x else np.asarray(x),
+             y=y if single_y else np.asarray(y),
 
              bounds_x=bounds_x,
              bounds_y=bounds_y,
-             
+
              tick_bounds_x=tick_bounds_x,
              tick_bounds_y=tick_bounds_y,
 
-             resize_axes=kwargs.pop('resize_axes', True) if n == n_curves - 1 else False,   # Avoid conflict
-             grid=kwargs.pop('grid', True) if n == n_curves - 1 else False,                 # Avoid conflict
-
-             **args,
+             # Curve arguments take precedence over their plurals, as when drawing curve by curve
+             **{**kwargs, **{singular(k): v for k, v in plurals.items()}, **cargs, **fargs},
              )
 
+    else:
+        for n in range(n_curves):
+
+            args = {**kwargs, **plural(n), **cparam(n), 'backend': fargs['backend']} if n != n_curves - 1 else {**kwargs, **plural(n), **cparam(n), **fargs}
+
+            # Deferred: only the last curve finishes the plot
+            with deferring() if deferred and n != n_curves - 1 else nullcontext():
+                f[n](x=x[n] if not single_x else x,
+                     y=y[n] if not single_y else y,
+
+                     bounds_x=bounds_x,
+                     bounds_y=bounds_y,
+
+                     tick_bounds_x=tick_bounds_x,
+                     tick_bounds_y=tick_bounds_y,
+
+                     resize_axes=kwargs.pop('resize_axes', True) if n == n_curves - 1 else False,   # Avoid conflict
+                     grid=kwargs.pop('grid', True) if n == n_curves - 1 else False,                 # Avoid conflict
+
+                     **args,
+                     )
+
     # Margins
     plt.subplots_adjust(top=     0.95                             if top    is None else top,
                         bottom=  0.11                             if bottom is None else bottom,
@@ -274,12 +283,8 @@ def comparison(x,
                         hspace=  0.6                              if hspace is None else hspace)
 
     if fargs['legend']:
-        # Legend placement
-        legend = (c for c in plt.gca().get_children() if isinstance(c, mpl.legend.Legend))
-
-        plt.savefig(f"{home()}/temp.pdf",
-                    bbox_extra_artists=legend,      # Expand figure to fit legend
-                    )
+        # Legend placement, resolved by a layout pass in memory
+        layout(plt.gcf())
 
     if show:
         plt.show()
@@ -8,32 +8,36 @@ Placeholders
 
 
 import numpy as np
-import pandas as pd
 
 from numpy import sin, cos
 
+from mpl_plotter.cache import datasets
+
 
 class MockData:
 
-    def filled_julia(self, xyz_2d=False, xyz_3d=False, df=False):
-        w, h, zoom = 1920, 1920, 1
+    @datasets.method
+    def filled_julia(self, xyz_2d=False, xyz_3d=False, df=False, size=1920):
+        w, h, zoom = size, size, 1
         cX, cY = -0.7, 0.27015
         moveX, moveY = 0.0, 0.0
         maxIter = 255
 
-        z = np.zeros(shape=(w, h))
-
-        for x in range(w):
-            for y in range(h):
-                zx = 1.5 * (x - w / 2) / (0.5 * zoom * w) + moveX
-                zy = 1.0 * (y - h / 2) / (0.5 * zoom * h) + moveY
-                i = maxIter
-                while zx * zx + zy * zy < 4 and i > 1:
-                    tmp = zx * zx - zy * zy + cX
-                    zy, zx = 2.0 * zx * zy + cY, tmp
-                    i -= 1
-
-                z[x, y] = (i << 21) + (i << 10) + i * 8
+        # Escape time of each pixel, iterating only over the pixels which have not escaped yet
+        zx = np.repeat(1.5 * (np.arange(w) - w / 2) / (0.5 * zoom * w) + moveX, h)
+        zy = np.tile(1.0 * (np.arange(h) - h / 2) / (0.5 * zoom * h) + moveY, w)
+        i = np.ones(w * h, dtype=int)
+        pixels = np.arange(w * h)
+        for n in range(maxIter - 1):
+            zx2, zy2 = zx * zx, zy * zy
+            inside = zx2 + zy2 < 4
+            if not inside.all():
+                i[pixels[~inside]] = maxIter - n
+                zx, zy, zx2, zy2, pixels = zx[inside], zy[inside], zx2[inside], zy2[inside], pixels[inside]
+            zy = 2.0 * zx * zy + cY
+            zx = zx2 - zy2 + cX
+
+        z = ((i << 21) + (i << 10) + i * 8).reshape(w, h).astype(float)
 
         x = np.linspace(0, w, w)
         y = np.linspace(0, h, h)
@@ -46,44 +50,47 @@ class MockData:
             return x, y, z
 
         if df is True:
+            import pandas as pd
             return pd.DataFrame(z)
 
         return np.linspace(0, w, w), np.linspace(0, h, h), z
 
-    def spirograph(self):
-        # Plot a spirograph
+    @datasets.method
+    def spirograph(self, size=8 * int(6 * 3.14 / 0.2)):
+        # Plot a spirograph, with ``size`` points along the curve
         R = 125
         d = 200
         r = 50
-        dtheta = 0.2
-        steps = 8 * int(6 * 3.14 / dtheta)
-        x = np.zeros(shape=(steps, 1))
-        y = np.zeros(shape=(steps, 1))
-        theta = 0
-        for step in range(0, steps):
-            theta = theta + dtheta
-            x[step] = (R - r) * cos(theta) + d * cos(((R - r) / r) * theta)
-            y[step] = (R - r) * sin(theta) - d * sin(((R - r) / r) * theta)
-
-        return x.flatten(), y.flatten()
-
-    def sinewave(self):
-        steps = 100
+        dtheta = 0.2 * (8 * int(6 * 3.14 / 0.2)) / size
+        theta = dtheta * np.arange(1, size + 1)
+        x = (R - r) * cos(theta) + d * cos(((R - r) / r) * theta)
+        y = (R - r) * sin(theta) - d * sin(((R - r) / r) * theta)
+
+        return x, y
+
+    @datasets.method
+    def sinewave(self, size=100):
+        steps = size
         x_max = 215
         x = np.linspace(-x_max, x_max, steps)
         y = 50 * np.sin(2 * np.pi * (x + x_max) / x_max)
         return x, y
 
-    def waterdrop(self):
+    @datasets.method
+    def waterdrop(self, size=1000, mesh=True):
 
-        d = 1000
+        d = size
 
         x = np.linspace(-3, 3, d)
         y = np.linspace(-3, 3, d)
 
-        x, y = np.meshgrid(x, y)
+        # Coordinate meshes, or vectors broadcast against each other
+        X, Y = np.meshgrid(x, y) if mesh else (x[np.newaxis, :], y[:, np.newaxis])
+
+        z = -(1 + cos(12 * np.sqrt(X * X + Y * Y))) / (0.5 * (X * X + Y * Y) + 2)
 
-        z = -(1 + cos(12 * np.sqrt(x * x + y * y))) / (0.5 * (x * x + y * y) + 2)
+        if mesh:
+            x, y = X, Y
 
         return x, y, z
 
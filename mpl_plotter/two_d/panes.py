@@ -7,18 +7,25 @@ Composition: ``panes``
 """
 
 
+import os
+import pickle
+import traceback
+
 import numpy as np
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 
 from math import floor, ceil
-from copy import deepcopy as dc
 
 from mpl_plotter import figure
 from mpl_plotter.two_d import line
 from mpl_plotter.two_d.comparison import comparison
+from mpl_plotter.two_d.spec import classify, singular, figure_args
+
+from mpl_plotter.render import agg_figure, layout, RenderError, _init_worker
 
-from mpl_plotter.utils import home
+
+# Output formats rendered as tiles in parallel mode
+_raster = ('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp')
 
 
 def panes(x,
@@ -35,6 +42,9 @@ def panes(x,
           right=None,
           wspace=None,
           hspace=None,
+          parallel=False,
+          workers=None,
+          spec=None,
           **kwargs):
     """
     .. raw:: latex
@@ -141,6 +151,12 @@ def panes(x,
     :param right:    plt.subplots_adjust parameter
     :param wspace:   plt.subplots_adjust parameter
     :param hspace:   plt.subplots_adjust parameter
+    :param parallel: If saving to a raster format (eg: ``filename='panes.png'``), render each pane as a tile
+                     at its final pixel size in a separate worker process, and composite the tiles into
+                     the output image. Vector outputs, plots shown or drawn on a given ``fig``, and plots
+                     whose functions or arguments cannot be pickled are drawn serially as usual
+    :param workers:  Number of worker processes of the parallel mode. Default: number of CPUs
+    :param spec:     Compiled keyword arguments (see ``plot_spec``), to which ``kwargs`` are added
     :param kwargs:   MPL Plotter plotting class keyword arguments for further customization
 
     :type x:         list of list or list of np.ndarray or np.ndarray
@@ -156,8 +172,14 @@ def panes(x,
     :type right:     float
     :type wspace:    float
     :type hspace:    float
+    :type parallel:  bool
+    :type workers:   int
+    :type spec:      mpl_plotter.two_d.spec.plot_spec
     """
 
+    # Pyplot is imported on use, so that importing MPL Plotter does not import it
+    import matplotlib.pyplot as plt
+
     ###############################
     #       INPUT VALIDATION      #
     ###############################
@@ -205,38 +227,19 @@ def panes(x,
     ###############################
     #          ARGUMENTS          #
     ###############################
-    # keys ------------------------------------------------------------
-    fkeys   = [
-        'backend',
-        'show',
-        'legend',
-        'legend_loc'
-    ]
-    lkeys   = [
-        'plot_label',
-        'plot_labels'
-    ]
-
-    # figure arguments ------------------------------------------------
-    fargs = {k: kwargs.pop(k) for k in list(set(fkeys) & set(kwargs.keys()))}
+    # Figure, legend and plural arguments, classified once if compiled into a spec
+    fargs, largs, plurals, kwargs = spec.classified(kwargs) if spec is not None else classify('panes', kwargs)
 
     fargs['backend']    = fargs.pop('backend',    'Qt5Agg')
     fargs['legend_loc'] = fargs.pop('legend_loc', (0.875, 0.55))
 
     # legend arguments -----------------------------------------------
-    largs = {k: kwargs.pop(k) for k in dc(kwargs).keys() if k in lkeys and len([kwargs[k]] if not isinstance(kwargs[k], list) else kwargs[k]) != n_plots}
-    fargs['legend'] = fargs.pop('legend', len([k for k in {**kwargs, **largs}.keys() if 'label' in k]) != 0)
+    # Labels given per pane are plural arguments
+    for k in [k for k in largs.keys() if len([largs[k]] if not isinstance(largs[k], list) else largs[k]) == n_plots]:
+        (plurals if k == 'plot_labels' else kwargs)[k] = largs.pop(k)
+    fargs['legend'] = fargs.pop('legend', len([k for k in {**kwargs, **largs, **plurals}.keys() if 'label' in k]) != 0)
 
     # plural arguments ------------------------------------------------
-    args    = line.__init__.__code__.co_varnames                        # Get line function arguments
-
-    ax_arg = lambda arg: arg[-2:] in ['_x', '_y']
-
-    plurals = [arg + 's' if not ax_arg(arg) else arg[:-2] + 's' + arg[-2:] for arg in args]
-
-    plurals = list(set(plurals) & set(kwargs.keys()))                   # Intersection of kwargs keys and plurals
-    plurals = {k: kwargs.pop(k) for k in plurals}                       # Dictionary of plurals
-
     def plural(i):
         """
         Get plural arguments of the ith plot.
@@ -247,13 +250,12 @@ def panes(x,
         _args = {}
 
         for k in plurals.keys():
-            _k = k[:-3] + k[-2:] if ax_arg(k) else k[:-1]
-            _args[_k] = plurals[k][i]
+            _args[singular(k)] = plurals[k][i]
 
         return _args
 
     # curve arguments ------------------------------------------------
-    cargs = {k: plurals.pop(k) for k in dc(plurals).keys() if isinstance(plurals[k], list) and (len(plurals[k]) != n_plots or all([isinstance(arg, list) for arg in plurals[k]]))}
+    cargs = {k: plurals.pop(k) for k in list(plurals.keys()) if isinstance(plurals[k], list) and (len(plurals[k]) != n_plots or all([isinstance(arg, list) for arg in plurals[k]]))}
 
     ###############################
     #           FIGURE            #
@@ -263,7 +265,21 @@ def panes(x,
 
     height = 3.5 if M == 1 else 4
 
-    if fig is None:
+    # Saved once all panes are drawn and the margins applied, not by each plot
+    filename = kwargs.pop('filename', None)
+    dpi      = kwargs.pop('dpi', None)
+
+    # Parallel: panes rendered as tiles of a raster output, without a Pyplot figure.
+    # Plotting functions and arguments must be sent to the workers, else panes are drawn serially
+    tiled = parallel and fig is None and not show and \
+            os.path.splitext(str(filename))[1].lower() in _raster and \
+            _picklable(f, kwargs, plurals, cargs, largs)
+    if tiled:
+        dpi      = dpi or mpl.rcParams['figure.dpi']
+        figsize  = (5 * N, height * M) if figsize is None else figsize
+        jobs     = []
+
+    elif fig is None:
         if figsize is None:
             fig = figure((5 * N, height * M), backend=fargs['backend'])
         else:
@@ -279,18 +295,19 @@ def panes(x,
         
         coords = (floor(n/(N)), (n % (N)))
 
-        ax_transient = plt.subplot2grid(shape,
-                                        coords,
-                                        rowspan=1,
-                                        colspan=1)
+        if not tiled:
+            ax_transient = plt.subplot2grid(shape,
+                                            coords,
+                                            rowspan=1,
+                                            colspan=1)
 
-        # Margins
-        plt.subplots_adjust(top=     0.88,
-                            bottom=  0.11,
-                            left=    0.1                              if left   is not None else left,
-                            right=   0.85 if M == 1 else 0.75         if right  is not None else right,
-                            wspace=  0.6                              if wspace is not None else wspace,
-                            hspace=  0.35                             if hspace is not None else hspace)
+            # Margins
+            plt.subplots_adjust(top=     0.88,
+                                bottom=  0.11,
+                                left=    0.1                              if left   is not None else left,
+                                right=   0.85 if M == 1 else 0.75         if right  is not None else right,
+                                wspace=  0.6                              if wspace is not None else wspace,
+                                hspace=  0.35                             if hspace is not None else hspace)
 
         # Retrieve curve arguments
         _cargs = {}
@@ -306,8 +323,7 @@ def panes(x,
                     _cargs[k] = _curve_arg
             else:
                 # single curve per panel
-                _k = k[:-3] + k[-2:] if ax_arg(k) else k[:-1]
-                _cargs[_k] = _curve_arg
+                _cargs[singular(k)] = _curve_arg
 
         # Pass keyword arguments to last
         args = {**kwargs, **plural(n), **_cargs} if n != n_plots - 1 else {**kwargs, **plural(n), **_cargs, **fargs, **largs}
@@ -346,6 +362,12 @@ def panes(x,
                 f if f is not None else\
                 line
 
+        if tiled:
+            # The legend is drawn over the composited tiles
+            args = {k: v for k, v in args.items() if k not in figure_args['panes']}
+            jobs.append((coords, X, Y, F, args))
+            continue
+
         comparison(X,
                    Y,
                    F,
@@ -357,22 +379,184 @@ def panes(x,
                    )
 
     # Margins
-    plt.subplots_adjust(top=     1.00                             if top    is None else top,
-                        bottom=  0.11                             if bottom is None else bottom,
-                        left=    0.1                              if left   is None else left,
-                        right=   (0.85 if M == 1 else 0.75)       if right  is None else right,
-                        wspace=  0.6                              if wspace is None else wspace,
-                        hspace=  0.35                             if hspace is None else hspace)
-
-    if fargs['legend']:
-
-        # Legend placement
-        legend = (c for c in plt.gca().get_children() if isinstance(c, mpl.legend.Legend))
-
-        # Save figure (necessary step for correct legend positioning, thanks to
-        # the _bbox_extra_artists_ argument of _plt.savefig_)
-        plt.savefig(f"{home()}/temp.pdf",
-                    bbox_extra_artists=legend,
-                    )
+    margins = dict(top=     1.00                             if top    is None else top,
+                   bottom=  0.11                             if bottom is None else bottom,
+                   left=    0.1                              if left   is None else left,
+                   right=   (0.85 if M == 1 else 0.75)       if right  is None else right,
+                   wspace=  0.6                              if wspace is None else wspace,
+                   hspace=  0.35                             if hspace is None else hspace)
+
+    if tiled:
+        return _composite(jobs, shape, figsize, dpi, margins, filename, workers,
+                          legend=fargs['legend'], legend_loc=fargs['legend_loc'], kwargs={**kwargs, **largs})
+
+    plt.subplots_adjust(**margins)
+
+    if filename:
+        fig.savefig(filename, dpi=dpi)
+    elif fargs['legend']:
+        # Legend placement, resolved by a layout pass in memory
+        layout(fig)
+
     if show:
         plt.show()
+
+
+def _picklable(*objects):
+    try:
+        pickle.dumps(objects)
+        return True
+    except Exception:
+        return False
+
+
+def _tiles(shape, figsize, dpi, margins):
+    """
+    Pixel bounds of the tile of each pane of a raster output, and the
+    position of its axes within it.
+
+    Tiles are split at the middle of the space between axes, so that
+    each tile holds its axes, tick labels and axis labels, and together
+    they cover the whole output.
+
+    :return: Output width and height [px], and a dictionary of
+             (row, column) -> ((top, bottom, left, right) [px], axes rectangle)
+    """
+    from matplotlib.gridspec import GridSpec
+
+    rows, columns = shape
+    width, height = round(figsize[0]*dpi), round(figsize[1]*dpi)
+
+    bottoms, tops, lefts, rights = GridSpec(rows, columns, **margins).get_grid_positions(None)
+
+    # Tile edges, as fractions of the figure width and height
+    x = [0, *((rights[:-1] + lefts[1:])/2), 1]
+    y = [1, *((bottoms[:-1] + tops[1:])/2), 0]
+
+    tiles = {}
+    for i in range(rows):
+        for j in range(columns):
+            t, b = round((1 - y[i])*height), round((1 - y[i + 1])*height)
+            l, r = round(x[j]*width),        round(x[j + 1]*width)
+            w, h = r - l, b - t
+            rect = [(lefts[j]*width - l)/w,
+                    (bottoms[i]*height - (height - b))/h,
+                    (rights[j] - lefts[j])*width/w,
+                    (tops[i] - bottoms[i])*height/h]
+            tiles[i, j] = ((t, b, l, r), rect)
+
+    return (width, height), tiles
+
+
+def _proxy(handle):
+    # Picklable description of a legend handle
+    from matplotlib.lines import Line2D
+    from matplotlib.collections import Collection, LineCollection, PathCollection
+    from matplotlib.colors import to_rgba
+
+    if isinstance(handle, Line2D):
+        return 'line', dict(color=handle.get_color(), alpha=handle.get_alpha(),
+                            linestyle=handle.get_linestyle(), linewidth=handle.get_linewidth(),
+                            marker=handle.get_marker(), markersize=handle.get_markersize(),
+                            markerfacecolor=handle.get_markerfacecolor(),
+                            markeredgecolor=handle.get_markeredgecolor())
+    if isinstance(handle, LineCollection):
+        return 'line', dict(color=to_rgba(handle.get_edgecolor()[0]), alpha=handle.get_alpha(),
+                            linewidth=handle.get_linewidth()[0])
+    if isinstance(handle, Collection):
+        colors = handle.get_facecolor()
+        color  = to_rgba(colors[0] if len(colors) else handle.get_edgecolor()[0])
+        if isinstance(handle, PathCollection):
+            return 'line', dict(color=color, linestyle='', marker='o')
+        return 'patch', dict(facecolor=color)
+    return 'patch', dict(facecolor=to_rgba(handle.get_facecolor()))
+
+
+def _render_pane(job):
+    """
+    Render a single pane as a tile in a worker process, returning the
+    tile and its legend entries, or the exception traceback instead of
+    raising it.
+    """
+    import matplotlib.pyplot as plt
+
+    (w, h), rect, dpi, X, Y, F, args = job
+    try:
+        fig = plt.figure(figsize=(w/dpi, h/dpi), dpi=dpi)
+        ax  = fig.add_axes(rect)
+
+        comparison(X, Y, F, fig=fig, ax=ax, legend=False, backend=None, show=False, **args)
+
+        fig.canvas.draw()
+        tile = np.array(fig.canvas.buffer_rgba())
+
+        handles, labels = ax.get_legend_handles_labels()
+
+        return True, (tile, [_proxy(handle) for handle in handles], labels)
+    except Exception:
+        return False, traceback.format_exc()
+    finally:
+        plt.close('all')
+
+
+def _composite(jobs, shape, figsize, dpi, margins, filename, workers, legend, legend_loc, kwargs):
+    """
+    Render the panes of a ``panes`` plot in parallel and save their
+    composite to ``filename``. The legend, gathering the entries of all
+    panes, is drawn over the composite.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotlib import font_manager
+    from matplotlib.image import imsave
+
+    (width, height), tiles = _tiles(shape, figsize, dpi, margins)
+
+    tasks   = [((tiles[coords][0][3] - tiles[coords][0][2], tiles[coords][0][1] - tiles[coords][0][0]),
+                tiles[coords][1], dpi, X, Y, F, args)
+               for coords, X, Y, F, args in jobs]
+    workers = min(os.cpu_count() if workers is None else workers, len(tasks))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(None,)) as executor:
+        results = list(executor.map(_render_pane, tasks))
+
+    image = np.full((height, width, 4), 255, dtype=np.uint8)
+    handles, labels = [], []
+    for i, ((coords, *_), (ok, result)) in enumerate(zip(jobs, results)):
+        if not ok:
+            raise RenderError(i, result)
+        tile, proxies, _labels = result
+
+        # Tiles may be a pixel short of their bounds, as figure sizes are rounded down
+        t, b, l, r = tiles[coords][0]
+        h, w = min(b - t, tile.shape[0]), min(r - l, tile.shape[1])
+        image[t:t + h, l:l + w] = tile[:h, :w]
+
+        handles += [Line2D([], [], **props) if kind == 'line' else Patch(**props) for kind, props in proxies]
+        labels  += _labels
+
+    if legend and handles:
+        # Legend drawn on a transparent figure of the size of the output, blended over the tiles
+        fig = agg_figure(figsize)
+        fig.set_dpi(dpi)
+        fig.patch.set_alpha(0)
+        legend_font = font_manager.FontProperties(family=kwargs.get('font', 'serif'),
+                                                  weight=kwargs.get('legend_weight', 'normal'),
+                                                  style=kwargs.get('legend_style', 'normal'),
+                                                  size=kwargs.get('legend_size', 13) + kwargs.get('font_size_increase', 0))
+        fig.legend(handles, labels,
+                   loc=legend_loc,
+                   bbox_to_anchor=kwargs.get('legend_bbox_to_anchor'), prop=legend_font,
+                   handleheight=kwargs.get('legend_handleheight'), ncol=kwargs.get('legend_ncol', 1))
+        fig.canvas.draw()
+
+        overlay = np.asarray(fig.canvas.buffer_rgba())[:height, :width]
+        alpha   = overlay[..., 3:]/255
+        image[:overlay.shape[0], :overlay.shape[1], :3] = \
+            (overlay[..., :3]*alpha + image[:overlay.shape[0], :overlay.shape[1], :3]*(1 - alpha)).round().astype(np.uint8)
+
+    imsave(filename, image, dpi=dpi)
+
+    return filename
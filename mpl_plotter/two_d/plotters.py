@@ -6,16 +6,17 @@ Plotting Methods
 ----------------
 """
 
+import os
 import re
-import inspect
 import warnings
 import numpy as np
-import pandas as pd
-import datetime as dt
+from copy import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
 from importlib import import_module
 
 import matplotlib as mpl
-from matplotlib import cm
+
 
 # METHODS
 from mpl_plotter.two_d.components import canvas
@@ -23,7 +24,14 @@ from mpl_plotter.two_d.components import guides
 from mpl_plotter.two_d.components import framing
 from mpl_plotter.two_d.components import text
 
+from mpl_plotter.methods.binding import binder
+from mpl_plotter.cache import digest, trajectories
+from mpl_plotter.render import agg_figure
+from mpl_plotter.timing import stages
+
+from mpl_plotter.color.maps import colors
 from mpl_plotter.two_d.mock import MockData
+from mpl_plotter.two_d.reduction import decimate, density, extrema, bin_means
 
 from mpl_plotter.utils import ensure_ndarray
 
@@ -32,13 +40,88 @@ from mpl_plotter.utils import ensure_ndarray
 warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
 
 
-class plot(canvas, guides, framing, text):
+# Whether plots are drawn within a ``deferred`` context, per thread and task
+_deferred = ContextVar('deferred', default=False)
+
+
+@contextmanager
+def deferred():
+    """
+    Draw plots without finishing them. Within this context, plots only
+    set up their figure and axes, and draw their graph. Canvas styling,
+    axis resizing, legend, color bar, text, ticks, margins, saving and
+    showing are left to a plot drawn afterwards on the same axes.
+
+    .. code-block:: python
+
+        with deferred():
+            for y in runs[:-1]:
+                line(x=x, y=y)
+        line(x=x, y=runs[-1], legend=True, filename='runs.pdf')
+    """
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def _interpgrid(a, xi, yi):
+    """
+    Bilinear interpolation of a 2D array at fractional grid coordinates.
+
+    Same as ``interpgrid`` in ``matplotlib.streamplot`` (Matplotlib 3.7),
+    which is not public, for arrays of coordinates: ``streamline`` colors
+    and sizes its trajectories with it as ``streamplot`` does.
+
+    :param a:  Array of shape (rows, columns)
+    :param xi: Column coordinates
+    :param yi: Row coordinates
+
+    :type a:   np.ndarray
+    :type xi:  np.ndarray
+    :type yi:  np.ndarray
+
+    :return: np.ndarray
+    """
+    rows, columns = np.shape(a)
+
+    x  = xi.astype(int)
+    y  = yi.astype(int)
+    xn = np.clip(x + 1, 0, columns - 1)
+    yn = np.clip(y + 1, 0, rows - 1)
+
+    xt = xi - x
+    yt = yi - y
+
+    a0 = a[y, x]*(1 - xt) + a[y, xn]*xt
+    a1 = a[yn, x]*(1 - xt) + a[yn, xn]*xt
+
+    return a0*(1 - yt) + a1*yt
+
+
+class plot(canvas, guides, framing, text, metaclass=binder):
+
+    # Arguments overwritten with values derived from the data when plotting
+    derived = ('bounds_x', 'bounds_y',
+               'bound_upper_x', 'bound_lower_x', 'bound_upper_y', 'bound_lower_y',
+               'pad_upper_x', 'pad_lower_x', 'pad_upper_y', 'pad_lower_y',
+               'tick_bounds_x', 'tick_bounds_y')
+
+    @property
+    def plt(self):
+        """
+        Pyplot, imported on first use. Plots drawn on a given
+        ``fig`` with ``show=False`` never import it.
+        """
+        return import_module("matplotlib.pyplot")
 
     def init(self):
 
         self.method_backend()
 
-        self.plt = import_module("matplotlib.pyplot")
+        # Keep the given values of the arguments derived from the data, to derive them anew on update
+        self.given = {arg: copy(getattr(self, arg)) for arg in self.derived}
 
         """
         Run
@@ -47,8 +130,81 @@ class plot(canvas, guides, framing, text):
         self.run()
 
     def run(self):
-        self.main()
-        self.finish()
+        with stages(self):
+            if _deferred.get():
+                self.draw()
+            else:
+                self.main()
+                self.finish()
+
+    def update(self, x=None, y=None, norm=None):
+        """
+        Replace the data of the plot, modifying its graph in place.
+        Supported by ``line`` and ``scatter`` plots.
+
+        Only the stages depending on the data are run again: axis
+        resizing, tick locations and tick labels. Fonts, grid, spines,
+        legend and color bar are left as they are, and so are the color
+        limits, so that colors remain comparable across updates.
+
+        :param x:    New x coordinates
+        :param y:    New y coordinates
+        :param norm: New color values
+
+        :type x:     list or np.ndarray
+        :type y:     list or np.ndarray
+        :type norm:  list or np.ndarray
+        """
+
+        # Plots supporting updates modify their graph in place in ``update_graph``
+        if not hasattr(self, 'update_graph'):
+            raise TypeError(f'{type(self).__name__} does not support update')
+
+        if x is not None:
+            self.x = ensure_ndarray(x)
+        if y is not None:
+            self.y = ensure_ndarray(y)
+        if norm is not None:
+            self.norm = ensure_ndarray(norm)
+
+        for arg, value in self.given.items():
+            setattr(self, arg, copy(value))
+
+        with stages(self):
+            self.update_graph()
+
+            self.method_resize_axes()
+            self.method_tick_locs()
+            self.method_tick_labels()
+
+        self.fig.canvas.draw_idle()
+
+    def pixels(self):
+        """
+        Number of pixel columns and rows of the axes at the output resolution.
+        """
+        dpi      = self.dpi if self.dpi is not None else self.fig.dpi
+        position = self.ax.get_position()
+        return (int(np.ceil(position.width  * self.fig.get_figwidth()  * dpi)),
+                int(np.ceil(position.height * self.fig.get_figheight() * dpi)))
+
+    def data_bounds(self, axis):
+        """
+        Lower and upper bounds of the axes along ``axis`` (``x`` or ``y``),
+        pads included, as resolved from the data in ``method_resize_axes``.
+        """
+        d     = getattr(self, axis)
+        lower = getattr(self, f'bound_lower_{axis}')
+        upper = getattr(self, f'bound_upper_{axis}')
+        lower = lower if lower is not None else d.min()
+        upper = upper if upper is not None else d.max()
+
+        given = getattr(self, f'bounds_{axis}')
+        if given is not None:
+            lower = given[0] if given[0] is not None else lower
+            upper = given[1] if given[1] is not None else upper
+
+        return lower - getattr(self, f'pad_lower_{axis}'), upper + getattr(self, f'pad_upper_{axis}')
 
     def main(self):
         # Canvas setup
@@ -63,6 +219,15 @@ class plot(canvas, guides, framing, text):
         # Plot
         self.plot()
 
+    def draw(self):
+        # Figure and axes
+        self.method_setup()
+
+        # Mock plot
+        self.mock()
+        # Plot
+        self.plot()
+
     def finish(self):
         # Resize axes
         self.method_resize_axes()
@@ -91,7 +256,7 @@ class line(plot):
 
     def __init__(self,
                  # Specifics
-                 x=None, y=None, line_width=2,
+                 x=None, y=None, line_width=2, line_decimation=False,
                  # Color
                  color='darkred', cmap='RdBu_r', alpha=None, norm=None,
                  # Backend
@@ -172,8 +337,12 @@ class line(plot):
 
         Specifics
         :param x: x
-        :param y: y
+        :param y: y. If 2D, each row is a curve, and all of them are drawn as a single
+                  collection. x is then shared by all curves, or 2D with a row per curve,
+                  and color, line_width and plot_label may be given per curve
         :param line_width: Line width
+        :param line_decimation: Draw only the first, last, lowest and highest point of the curve in each
+                                pixel column of the axes. For large series with x sorted in ascending order
 
         Color:
         :param color: Solid color
@@ -193,8 +362,7 @@ class line(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(line).parameters:
-            setattr(self, item, eval(item))
+        line._bind(self, locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -204,30 +372,122 @@ class line(plot):
 
     def plot(self):
 
+        # Many curves
+        if self.y.ndim == 2:
+            self.graph = self.ax.add_collection(self.curves())
+            self.labels()
+            return
+
+        x, y, _norm = self.decimated()
+
         if isinstance(self.norm, type(None)):
-            self.graph = self.ax.plot(self.x, self.y, label=self.plot_label, linewidth=self.line_width,
+            self.graph = self.ax.plot(x, y, label=self.plot_label, linewidth=self.line_width,
                                       color=self.color,
                                       zorder=self.zorder,
                                       alpha=self.alpha,
                                       )[0]
         else:
-            # Create a set of line segments so that we can color them individually
-            # This creates the points as a N x 1 x 2 array so that we can stack points
-            # together easily to get the segments. The segments array for line collection
-            # needs to be (numlines) x (points per line) x 2 (for x and y)
-            points = np.array([self.x, self.y]).T.reshape(-1, 1, 2)
-            segments = np.concatenate([points[:-1], points[1:]], axis=1)
-
             # Create a continuous norm to map from data points to colors
-            _norm = self.norm(self.x) if hasattr(self.norm, '__call__') else self.norm
-            norm = self.plt.Normalize(_norm.min(), _norm.max())
-            lc = mpl.collections.LineCollection(segments, cmap=self.cmap, norm=norm)
+            norm = mpl.colors.Normalize(_norm.min(), _norm.max())
+            lc = mpl.collections.LineCollection(self.segments(x, y), cmap=self.cmap, norm=norm)
 
             # Set the values used for colormapping
-            lc.set_array(self.norm)
+            lc.set_array(_norm)
             lc.set_linewidth(self.line_width)
             self.graph = self.ax.add_collection(lc)
 
+    def decimated(self):
+        """
+        x, y and norm values to draw: all of them, or if ``line_decimation``
+        is set, only the points defining the envelope of the curve within
+        the x bounds of the axes, at its pixel resolution.
+        """
+
+        norm = self.norm(self.x) if hasattr(self.norm, '__call__') else self.norm
+
+        if not self.line_decimation or not np.issubdtype(self.x.dtype, np.number):
+            return self.x, self.y, norm
+
+        columns, _ = self.pixels()
+
+        # Nothing to gain below 4 points per column: first, last, lowest and highest
+        if self.x.size <= 4*columns:
+            return self.x, self.y, norm
+
+        if not (self.x[1:] >= self.x[:-1]).all():
+            print('line_decimation: x must be sorted in ascending order to decimate the curve. Drawing all points')
+            return self.x, self.y, norm
+
+        lower, upper = self.data_bounds('x')
+
+        if not upper > lower:
+            return self.x, self.y, norm
+
+        i = decimate(self.x, self.y, lower, upper, columns)
+
+        return self.x[i], self.y[i], ensure_ndarray(norm)[i] if norm is not None else None
+
+    @staticmethod
+    def segments(x, y):
+        # Create a set of line segments so that we can color them individually
+        # This creates the points as a N x 1 x 2 array so that we can stack points
+        # together easily to get the segments. The segments array for line collection
+        # needs to be (numlines) x (points per line) x 2 (for x and y)
+        points = np.array([x, y]).T.reshape(-1, 1, 2)
+        return np.concatenate([points[:-1], points[1:]], axis=1)
+
+    def curves(self):
+        """
+        Collection of the curves of a 2D ``y``, with per-curve colors and
+        widths, or if ``norm`` is given, colored by ``norm`` segment by
+        segment.
+        """
+
+        x, y = np.broadcast_arrays(self.x, self.y)
+        points = np.stack([x, y], axis=-1)
+
+        color = mpl.colors.to_rgba_array(self.color if self.color is not None else 'C0', alpha=self.alpha)
+        width = np.atleast_1d(self.line_width if self.line_width is not None else mpl.rcParams['lines.linewidth'])
+
+        if self.norm is None:
+            # One polyline per curve
+            return mpl.collections.LineCollection(points, colors=color, linewidths=width, zorder=self.zorder)
+
+        # Segments of all curves, with the norm value and width of their curve
+        norm = self.norm(x) if hasattr(self.norm, '__call__') else np.broadcast_to(self.norm, y.shape)
+        segments = np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+
+        lc = mpl.collections.LineCollection(segments, cmap=self.cmap, norm=mpl.colors.Normalize(np.nanmin(norm), np.nanmax(norm)),
+                                            linewidths=np.repeat(np.resize(width, y.shape[0]), y.shape[1] - 1),
+                                            alpha=self.alpha, zorder=self.zorder)
+        lc.set_array(np.asarray(norm)[:, :-1].ravel())
+        return lc
+
+    def labels(self):
+        # Legend entries of the curves of a 2D ``y``: one per labelled curve, or a
+        # single one for all curves, styled after the first curve they label
+        labels = self.plot_label if isinstance(self.plot_label, (list, tuple, np.ndarray)) else [self.plot_label]
+        color  = self.graph.get_colors() if self.norm is None else [self.graph.cmap(0.5)]
+        width  = self.graph.get_linewidths()
+        for i, label in enumerate(labels):
+            if label is not None:
+                self.ax.plot([], [], label=label, color=color[i % len(color)], linewidth=width[i % len(width)], alpha=self.alpha)
+
+    def update_graph(self):
+        if self.y.ndim == 2:
+            curves = self.curves()
+            self.graph.set_segments(curves.get_segments())
+            if self.norm is not None:
+                self.graph.set_array(curves.get_array())
+            return
+
+        x, y, norm = self.decimated()
+        if isinstance(self.graph, mpl.collections.LineCollection):
+            self.graph.set_segments(self.segments(x, y))
+            self.graph.set_array(norm)
+        else:
+            self.graph.set_data(x, y)
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
             self.x, self.y = MockData().spirograph()
@@ -239,7 +499,7 @@ class scatter(plot):
 
     def __init__(self,
                  # Specifics
-                 x=None, y=None, scatter_size=5, scatter_marker='o', scatter_facecolors=None,
+                 x=None, y=None, scatter_size=5, scatter_marker='o', scatter_facecolors=None, scatter_density=False,
                  # Specifics: color
                  color="C0", cmap='RdBu_r', alpha=None, norm=None,
                  # Backend
@@ -323,6 +583,10 @@ class scatter(plot):
         :param y: y
         :param scatter_size: Point size
         :param scatter_marker: Dot scatter_marker
+        :param scatter_density: Draw the points as a single image at the pixel resolution of the axes, in which
+                                each pixel shows the mean ``norm`` of the points it contains, or if no ``norm``
+                                is given, the ``color`` of the points with an opacity following their number,
+                                on a log scale. True, or the number of points above which to do so
 
         Color:
         :param color: Solid color
@@ -342,8 +606,7 @@ class scatter(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(scatter).parameters:
-            setattr(self, item, eval(item))
+        scatter._bind(self, locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -353,7 +616,20 @@ class scatter(plot):
 
     def plot(self):
 
-        if self.norm is not None:
+        if self.dense():
+            image = self.image()
+            self.graph = self.ax.imshow(image, extent=self.extent(), origin='lower',
+                                        cmap=self.cmap if self.norm is not None else self.density_cmap(),
+                                        norm=None if self.norm is not None else mpl.colors.LogNorm(),
+                                        interpolation='nearest', aspect='auto',
+                                        zorder=self.zorder,
+                                        alpha=self.alpha)
+            # Color limits of the points, rather than of their mean in each pixel
+            if self.norm is not None:
+                self.graph.set_clim(np.nanmin(self.norm), np.nanmax(self.norm))
+            else:
+                self.graph.set_clim(*self.density_clim(image))
+        elif self.norm is not None:
             self.graph = self.ax.scatter(self.x, self.y, label=self.plot_label,
                                          s=self.scatter_size, marker=self.scatter_marker, facecolors=self.scatter_facecolors,
                                          c=self.norm, cmap=self.cmap,
@@ -366,6 +642,40 @@ class scatter(plot):
                                          zorder=self.zorder,
                                          alpha=self.alpha)
 
+    def dense(self):
+        # Density mode, if chosen or above the threshold number of points
+        return self.scatter_density is True or \
+            (self.scatter_density not in [None, False] and self.x.size > self.scatter_density)
+
+    def extent(self):
+        return (*self.data_bounds('x'), *self.data_bounds('y'))
+
+    def image(self):
+        norm = ensure_ndarray(self.norm) if self.norm is not None else None
+        return density(self.x, self.y, norm, self.extent(), self.pixels())
+
+    def density_cmap(self):
+        # Plot color, with opacity following the number of points in each pixel
+        rgb = mpl.colors.to_rgb(self.color)
+        return mpl.colors.LinearSegmentedColormap.from_list('density', [(*rgb, 0.25), (*rgb, 1)])
+
+    @staticmethod
+    def density_clim(image):
+        # Point counts on a log scale, from single points to the densest pixel
+        return 1, max(image.max() if image.count() else 1, 2)
+
+    def update_graph(self):
+        if isinstance(self.graph, mpl.image.AxesImage):
+            image = self.image()
+            self.graph.set_data(image)
+            self.graph.set_extent(self.extent())
+            if self.norm is None:
+                self.graph.set_clim(*self.density_clim(image))
+            return
+        self.graph.set_offsets(np.column_stack([self.x, self.y]))
+        if self.norm is not None:
+            self.graph.set_array(self.norm)
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
             self.x, self.y = MockData().spirograph()
@@ -456,9 +766,10 @@ class heatmap(plot):
         mpl_plotter - 2D
 
         Specifics
-        :param x: x
-        :param y: y
-        :param z: z
+        :param x: x: 1D vector, or 2D array of the same shape as z
+        :param y: y: 1D vector, or 2D array of the same shape as z
+        :param z: z: 2D array, memory-mapped array or path to a .npy file. Memory-mapped arrays are read
+                  at the pixel resolution of the axes only, if x and y define a rectilinear grid
         :param heatmap_normvariant: Detailed information in the Matplotlib documentation
 
         Color:
@@ -479,8 +790,11 @@ class heatmap(plot):
         """
         # T
         # urn all instance arguments to instance attributes
-        for item in inspect.signature(heatmap).parameters:
-            setattr(self, item, eval(item))
+        heatmap._bind(self, locals())
+
+        # Memory-map z if given as a path to a .npy file
+        if isinstance(self.z, (str, os.PathLike)):
+            self.z = np.load(self.z, mmap_mode='r')
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -490,18 +804,94 @@ class heatmap(plot):
         self.init()
 
     def plot(self):
-        self.graph = self.ax.pcolormesh(self.x, self.y, self.z, cmap=self.cmap,
+        coordinates = self.coordinates()
+
+        # Single row or column: cell sizes cannot be told from the coordinates, drawn by pcolormesh
+        if coordinates is not None and min(c.size for c in coordinates) < 2:
+            coordinates = None
+
+        # Memory-mapped z on a rectilinear grid: read at most one row and column per pixel
+        z = self.z
+        if isinstance(z, np.memmap) and coordinates is not None:
+            columns, rows = self.pixels()
+            step_x = max(1, z.shape[1]//columns)
+            step_y = max(1, z.shape[0]//rows)
+            z = np.asarray(z[::step_y, ::step_x])
+
+        if coordinates is not None and all(self.uniform(c) for c in coordinates):
+            # Regular grid: single image
+            self.graph = self.ax.imshow(z, extent=self.extent(*coordinates), origin='lower',
+                                        cmap=self.cmap,
+                                        interpolation='nearest', aspect='auto',
                                         zorder=self.zorder,
                                         alpha=self.alpha,
-                                        label=self.plot_label,
-                                        shading='auto'
-                                        )
+                                        label=self.plot_label)
+        elif coordinates is not None and coordinates[0].size == self.z.shape[1] and coordinates[1].size == self.z.shape[0] \
+                and all((np.diff(c) > 0).all() or (np.diff(c) < 0).all() for c in coordinates):
+            # Rectilinear grid: single image with non-uniform pixels, centered on the coordinates
+            x, y = coordinates
+            extent = self.extent(x, y)
+            if z is not self.z:
+                x, y = x[::step_x], y[::step_y]
+            if x[0] > x[-1]:
+                x, z = x[::-1], z[:, ::-1]
+            if y[0] > y[-1]:
+                y, z = y[::-1], z[::-1]
+            self.graph = mpl.image.NonUniformImage(self.ax, cmap=self.cmap, interpolation='nearest',
+                                                   zorder=self.zorder,
+                                                   alpha=self.alpha,
+                                                   label=self.plot_label)
+            self.graph.set_data(x, y, z)
+            # Non-uniform images fill the axes: clip them to the cells around the coordinates
+            left, right, bottom, top = extent
+            self.ax.add_image(self.graph)
+            self.graph.set_clip_path(mpl.patches.Rectangle((left, bottom), right - left, top - bottom,
+                                                           transform=self.ax.transData))
+        else:
+            self.graph = self.ax.pcolormesh(self.x, self.y, self.z, cmap=self.cmap,
+                                            zorder=self.zorder,
+                                            alpha=self.alpha,
+                                            label=self.plot_label,
+                                            shading='auto'
+                                            )
+        # Color limits of the whole of z
+        if z is not self.z:
+            self.graph.set_clim(*extrema(self.z))
+
         # Resize axes
         self.method_resize_axes()
 
+    def coordinates(self):
+        """
+        x and y coordinates of the columns and rows of ``z``, if the grid is
+        rectilinear: given as vectors, or as 2D arrays constant along columns
+        (x) and rows (y), as returned by ``np.meshgrid``. Otherwise, None.
+        """
+        if self.x.ndim == 1 and self.y.ndim == 1:
+            return self.x, self.y
+        if self.x.ndim == 2 and self.y.ndim == 2 and (self.x == self.x[:1]).all() and (self.y == self.y[:, :1]).all():
+            return self.x[0], self.y[:, 0]
+
+    @staticmethod
+    def uniform(c):
+        d = np.diff(c)
+        return d.size > 0 and d[0] != 0 and np.allclose(d, d[0], rtol=1e-5, atol=0)
+
+    def extent(self, x, y):
+        """
+        Image extent: (left, right, bottom, top). Coordinates are cell
+        edges if there is one more of them than columns or rows of ``z``,
+        and cell centers otherwise, as with Matplotlib's ``shading='auto'``.
+        """
+        def edges(c, n):
+            if c.size == n + 1:
+                return c[0], c[-1]
+            return c[0] - (c[1] - c[0])/2, c[-1] + (c[-1] - c[-2])/2
+        return (*edges(x, self.z.shape[1]), *edges(y, self.z.shape[0]))
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
-            self.x, self.y, self.z = MockData().waterdrop()
+            self.x, self.y, self.z = MockData().waterdrop(mesh=False)
 
 
 class quiver(plot):
@@ -511,6 +901,7 @@ class quiver(plot):
                  x=None, y=None, u=None, v=None,
                  quiver_rule=None, quiver_custom_rule=None,
                  quiver_vector_width=0.01, quiver_vector_min_shaft=2, quiver_vector_length_threshold=0.1,
+                 quiver_arrows=None,
                  # Color
                  color=None, cmap='RdBu_r', alpha=None, norm=None,
                  # Backend
@@ -600,6 +991,8 @@ class quiver(plot):
         :param quiver_vector_width: Vector width
         :param quiver_vector_min_shaft: Minimum vector shaft
         :param quiver_vector_length_threshold: Minimum vector length
+        :param quiver_arrows: Arrow budget. Fields with more vectors are binned onto a grid of at most
+                              this many cells, and the vectors (and custom rule values) in each cell averaged
 
         Color:
         :param color: Solid color
@@ -619,8 +1012,7 @@ class quiver(plot):
         """
         # T
         # urn all instance arguments to instance attributes
-        for item in inspect.signature(quiver).parameters:
-            setattr(self, item, eval(item))
+        quiver._bind(self, locals())
 
 
         # Ensure x and y are NumPy arrays
@@ -630,6 +1022,10 @@ class quiver(plot):
 
     def plot(self):
 
+        # Arrow budget
+        if self.quiver_arrows is not None and np.size(self.x) > self.quiver_arrows:
+            self.binned()
+
         # Color rule
         self.method_rule()
 
@@ -651,6 +1047,30 @@ class quiver(plot):
             self.v = np.random.random(100)
             self.norm = np.sqrt(self.u ** 2 + self.v ** 2)
 
+    def binned(self):
+        """
+        Bin the field onto a grid of at most ``quiver_arrows`` cells, shaped
+        after the extent of the data, replacing the vectors in each cell by
+        their mean, placed at the center of the cell.
+        """
+        x, y, u, v = (np.asarray(a, dtype=float).ravel() for a in (self.x, self.y, self.u, self.v))
+
+        extent  = (np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y))
+        ratio   = ((extent[1] - extent[0]) or 1)/((extent[3] - extent[2]) or 1)
+        columns = int(np.clip(np.sqrt(self.quiver_arrows*ratio), 1, self.quiver_arrows))
+        rows    = max(1, self.quiver_arrows//columns)
+
+        values = [u, v]
+        rule   = self.quiver_custom_rule is not None and np.size(self.quiver_custom_rule) == x.size
+        if rule:
+            values.append(np.asarray(self.quiver_custom_rule, dtype=float).ravel())
+
+        binned = bin_means(x, y, values, extent, (columns, rows))
+
+        self.x, self.y, self.u, self.v = binned[:4]
+        if rule:
+            self.quiver_custom_rule = binned[4]
+
     def method_rule(self):
         # Rule
         if isinstance(self.quiver_custom_rule, type(None)):
@@ -663,12 +1083,11 @@ class quiver(plot):
         # Color determined by rule function
         c = self.quiver_rule
         # Flatten and normalize
-        c = (c.ravel() - c.min())/c.ptp()
+        c = (c.ravel() - c.min())/np.ptp(c)
         # Repeat for each body line and two head lines
         c = np.concatenate((c, np.repeat(c, 2)))
         # Colormap
-        cmap = mpl.cm.get_cmap(self.cmap)
-        self.color = cmap(c)
+        self.color = colors(c, self.cmap)
 
 
 class streamline(plot):
@@ -781,8 +1200,7 @@ class streamline(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(streamline).parameters:
-            setattr(self, item, eval(item))
+        streamline._bind(self, locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -798,13 +1216,117 @@ class streamline(plot):
         self.method_rule()
 
         # Plot
-        self.graph = self.ax.streamplot(self.x, self.y, self.u, self.v,
-                                        color=self.color,
-                                        cmap=self.cmap,
-                                        linewidth=self.streamline_line_width,
-                                        density=self.streamline_line_density,
-                                        zorder=self.zorder,
-                                        ).lines
+        self.graph = self.streamlines(*self.integrate())
+
+    def integrate(self):
+        """
+        Trajectories of the streamlines of the field, integrated by
+        Matplotlib's ``streamplot`` once per field and line density, and
+        cached afterwards.
+
+        :return: Points of all trajectories in data coordinates, one after the other,
+                 and the index of the first point of each trajectory (and of the end)
+        """
+        key    = (digest(self.x, self.y, self.u, self.v), tuple(np.ravel(self.streamline_line_density)))
+        cached = trajectories.get(key)
+        if cached is not None:
+            return cached
+
+        segments = agg_figure().add_subplot().streamplot(self.x, self.y, self.u, self.v,
+                                                         density=self.streamline_line_density,
+                                                         color='black').lines.get_segments()
+        segments = np.array(segments).reshape(-1, 2, 2)
+
+        # Consecutive segments of the same trajectory share their end points
+        if len(segments):
+            bounds = np.concatenate([[0], np.flatnonzero((segments[1:, 0] != segments[:-1, 1]).any(axis=1)) + 1, [len(segments)]])
+        else:
+            bounds = np.zeros(1, dtype=np.intp)
+
+        # Start points of all segments, and end point of each trajectory
+        points = np.insert(segments[:, 0], bounds[1:], segments[bounds[1:] - 1, 1], axis=0)
+        starts = bounds + np.arange(bounds.size)
+
+        return trajectories.put(key, (points, starts))
+
+    def streamlines(self, points, starts):
+        """
+        Draw a set of trajectories as Matplotlib's ``streamplot`` does: a
+        ``LineCollection`` colored and sized by interpolating ``color`` and
+        ``streamline_line_width`` along each trajectory, and an arrow halfway
+        along each.
+
+        :param points: Points of all trajectories, one after the other
+        :param starts: Index of the first point of each trajectory, and of the end
+
+        :type points:  np.ndarray
+        :type starts:  np.ndarray
+
+        :return: LineCollection
+        """
+
+        zorder     = self.zorder if self.zorder is not None else mpl.lines.Line2D.zorder
+        width      = self.streamline_line_width
+        color      = self.color
+        multicolor = isinstance(color, np.ndarray)
+
+        # Segments: pairs of consecutive points of the same trajectory
+        joined = np.ones(max(len(points) - 1, 0), dtype=bool)
+        joined[starts[1:-1] - 1] = False
+        segments = np.stack([points[:-1][joined], points[1:][joined]], axis=1)
+
+        # Grid coordinates of the first point of each segment
+        x0 = self.x[0] if self.x.ndim == 2 else self.x
+        y0 = self.y[:, 0] if self.y.ndim == 2 else self.y
+        gx = np.clip((segments[:, 0, 0] - x0[0])/(x0[-1] - x0[0])*(x0.size - 1), 0, x0.size - 1)
+        gy = np.clip((segments[:, 0, 1] - y0[0])/(y0[-1] - y0[0])*(y0.size - 1), 0, y0.size - 1)
+
+        line_kw  = dict(zorder=zorder)
+        arrow_kw = dict(arrowstyle='-|>', mutation_scale=10, zorder=zorder)
+
+        if multicolor:
+            color  = np.ma.masked_invalid(color)
+            values = _interpgrid(color, gx, gy)
+            cmap   = mpl.colormaps[self.cmap] if isinstance(self.cmap, str) else self.cmap
+            norm   = mpl.colors.Normalize(color.min(), color.max())
+        else:
+            line_kw['color'] = arrow_kw['color'] = color
+
+        if isinstance(width, np.ndarray):
+            widths = _interpgrid(width, gx, gy)
+            line_kw['linewidth'] = widths
+        else:
+            line_kw['linewidth'] = arrow_kw['linewidth'] = width
+
+        # Arrows halfway along each trajectory
+        arrows = []
+        for k, (a, b) in enumerate(zip(starts[:-1], starts[1:])):
+            tx, ty = points[a:b].T
+            s = np.cumsum(np.hypot(np.diff(tx), np.diff(ty)))
+            n = np.searchsorted(s, s[-1]/2.)
+            # Index of the segment starting at point n, trajectories having one segment less than points
+            i = a - k + n
+            if isinstance(width, np.ndarray):
+                arrow_kw['linewidth'] = widths[i]
+            if multicolor:
+                arrow_kw['color'] = cmap(norm(values[i]))
+            arrows.append(mpl.patches.FancyArrowPatch((tx[n], ty[n]), (np.mean(tx[n:n + 2]), np.mean(ty[n:n + 2])),
+                                                      transform=self.ax.transData, **arrow_kw))
+
+        lc = mpl.collections.LineCollection(segments, transform=self.ax.transData, **line_kw)
+        lc.sticky_edges.x[:] = [x0[0], x0[-1]]
+        lc.sticky_edges.y[:] = [y0[0], y0[-1]]
+        if multicolor:
+            lc.set_array(values)
+            lc.set_cmap(cmap)
+            lc.set_norm(norm)
+
+        self.ax.add_collection(lc)
+        for p in arrows:
+            self.ax.add_patch(p)
+        self.ax.autoscale_view()
+
+        return lc
 
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
@@ -934,8 +1456,7 @@ class fill_area(plot):
         """
 
         # Turn all instance arguments to instance attributes
-        for item in inspect.signature(fill_area).parameters:
-            setattr(self, item, eval(item))
+        fill_area._bind(self, locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -966,21 +1487,39 @@ class fill_area(plot):
             self.ax.fill_between(self.x, self.y, np.zeros(self.y.shape), facecolor=self.color, alpha=self.alpha)
 
     def i_below(self):
-        # Curve
-        c = np.zeros(self.y.shape, dtype=float)
-        for i in range(len(c)):
-            c[i] = self.y[i] if self.y[i] <= self.z[i] else self.z[i]
-        return c
+        # Lower envelope of the curves
+        return np.minimum(self.y, self.z)
 
     def i_above(self):
-        # Curve
-        c = np.zeros(self.y.shape, dtype=float)
-        for i in range(len(c)):
-            c[i] = self.y[i] if self.y[i] >= self.z[i] else self.z[i]
-        return c
+        # Upper envelope of the curves
+        return np.maximum(self.y, self.z)
 
     def intersection(self):
-        return np.nonzero(np.absolute(self.y - self.z) == min(np.absolute(self.y - self.z)))[0]
+        """
+        Points where the curves meet: samples at which they are equal, and
+        crossings between samples, where y - z changes sign, linearly
+        interpolated.
+
+        :return: x and y coordinates of the intersections, sorted along the curves
+        """
+        d    = self.y - self.z
+        sign = np.sign(d)
+
+        # Crossings between samples i and i + 1, at fraction t of the segment
+        i = np.flatnonzero(sign[:-1]*sign[1:] < 0)
+        t = d[i]/(d[i] - d[i + 1])
+
+        # Position along the curves (sample index + fraction)
+        position = np.concatenate([np.flatnonzero(sign == 0), i + t])
+        order    = np.argsort(position, kind='stable')
+        position = position[order]
+
+        index    = np.minimum(position.astype(int), d.size - 2) if d.size > 1 else position.astype(int)
+        fraction = position - index
+        x = self.x[index] + fraction*(self.x[np.minimum(index + 1, d.size - 1)] - self.x[index])
+        y = self.y[index] + fraction*(self.y[np.minimum(index + 1, d.size - 1)] - self.y[index])
+
+        return x, y
 
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
@@ -989,8 +1528,8 @@ class fill_area(plot):
             self.z = 1 - MockData().boltzman(self.x, 0.5, 1)
             line(x=self.x, y=self.y,
                  grid=False, resize_axes=False,
-                 ax=self.ax, fig=self.fig)
+                 ax=self.ax, fig=self.fig, backend=self.backend)
             line(x=self.x, y=self.z,
                  grid=False, resize_axes=False,
-                 ax=self.ax, fig=self.fig)
+                 ax=self.ax, fig=self.fig, backend=self.backend)
             self.fill_area_below = True
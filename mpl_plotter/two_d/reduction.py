@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Data Reduction
+--------------
+"""
+
+import numpy as np
+
+
+def decimate(x, y, lower, upper, columns, chunk=2**20):
+    """
+    Indices of the points of a curve which, drawn over ``columns`` pixel
+    columns spanning ``[lower, upper]``, result in the same envelope as
+    the whole curve: the first, last, lowest and highest point of each
+    column.
+
+    Points outside ``[lower, upper]`` are dropped, except for the ones
+    next to each bound, so that the curve reaches the edges of the axes.
+    The curve is processed ``chunk`` points at a time.
+
+    :param x:       x coordinates, sorted in ascending order
+    :param y:       y coordinates
+    :param lower:   Lower x bound
+    :param upper:   Upper x bound
+    :param columns: Number of pixel columns
+    :param chunk:   Number of points processed at a time
+
+    :type x:        np.ndarray
+    :type y:        np.ndarray
+    :type lower:    float
+    :type upper:    float
+    :type columns:  int
+    :type chunk:    int
+
+    :return: Indices of the points to draw, sorted in ascending order
+    """
+
+    start = max(np.searchsorted(x, lower, 'left') - 1, 0)
+    stop  = min(np.searchsorted(x, upper, 'right') + 1, x.size)
+    width = (upper - lower)/columns
+
+    indices = []
+    for a in range(start, stop, chunk):
+        b = min(a + chunk, stop)
+        n = b - a
+
+        # Pixel column of each point, and first point of each column
+        column = np.floor((x[a:b] - lower)/width)
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(column)) + 1])
+        ends   = np.concatenate([starts[1:], [n]]) - 1
+        counts = ends - starts + 1
+
+        # First index of the lowest and highest point of each column
+        i    = np.arange(n)
+        seg  = y[a:b]
+        low  = np.minimum.reduceat(np.where(seg == np.repeat(np.minimum.reduceat(seg, starts), counts), i, n), starts)
+        high = np.minimum.reduceat(np.where(seg == np.repeat(np.maximum.reduceat(seg, starts), counts), i, n), starts)
+
+        # Columns containing NaNs keep their first and last points only
+        indices.append(a + np.unique(np.concatenate([starts, ends, np.minimum(low, ends), np.minimum(high, ends)])))
+
+    return np.concatenate(indices) if indices else np.arange(0)
+
+
+def density(x, y, norm, extent, shape):
+    """
+    Bin a set of points into an image of the given ``shape``, spanning
+    ``extent``. Points outside of it are dropped.
+
+    :param x:      x coordinates
+    :param y:      y coordinates
+    :param norm:   Value of each point. If None, points are counted
+    :param extent: Image bounds: (x lower, x upper, y lower, y upper)
+    :param shape:  Number of pixel columns and rows
+
+    :type x:       np.ndarray
+    :type y:       np.ndarray
+    :type norm:    np.ndarray
+    :type extent:  tuple
+    :type shape:   tuple
+
+    :return: Masked image of shape (rows, columns): the number of points in each pixel,
+             or if ``norm`` is given, their mean value. Pixels without points are masked.
+    """
+
+    columns, rows = shape
+
+    inside, pixel = _pixels(x, y, extent, shape)
+
+    counts = np.bincount(pixel, minlength=rows*columns).reshape(rows, columns)
+
+    if norm is None:
+        image = counts.astype(float)
+    else:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            image = np.bincount(pixel, weights=norm[inside], minlength=rows*columns).reshape(rows, columns)/counts
+
+    return np.ma.masked_where(counts == 0, image)
+
+
+def bin_means(x, y, values, extent, shape):
+    """
+    Bin a set of points onto a grid of the given ``shape``, spanning
+    ``extent``, and average the values of the points in each cell.
+    Points outside of it are dropped.
+
+    :param x:      x coordinates
+    :param y:      y coordinates
+    :param values: Arrays of values of each point
+    :param extent: Grid bounds: (x lower, x upper, y lower, y upper)
+    :param shape:  Number of grid columns and rows
+
+    :type x:       np.ndarray
+    :type y:       np.ndarray
+    :type values:  list of np.ndarray
+    :type extent:  tuple
+    :type shape:   tuple
+
+    :return: x and y coordinates of the center of each non-empty cell, and the
+             mean of each array of ``values`` in it
+    """
+
+    columns, rows = shape
+
+    inside, pixel = _pixels(x, y, extent, shape)
+
+    counts = np.bincount(pixel, minlength=rows*columns)
+    cells  = np.flatnonzero(counts)
+
+    means = [np.bincount(pixel, weights=v[inside], minlength=rows*columns)[cells]/counts[cells] for v in values]
+
+    xc = extent[0] + (cells % columns + 0.5)*(extent[1] - extent[0])/columns
+    yc = extent[2] + (cells // columns + 0.5)*(extent[3] - extent[2])/rows
+
+    return (xc, yc, *means)
+
+
+def _pixels(x, y, extent, shape):
+    # Points inside the extent, and the flat index of the pixel of each,
+    # points on the upper bounds included in the last column and row
+    columns, rows = shape
+
+    inside = (x >= extent[0]) & (x <= extent[1]) & (y >= extent[2]) & (y <= extent[3])
+
+    ix = np.minimum(((x[inside] - extent[0])/((extent[1] - extent[0]) or 1)*columns).astype(np.intp), columns - 1)
+    iy = np.minimum(((y[inside] - extent[2])/((extent[3] - extent[2]) or 1)*rows).astype(np.intp), rows - 1)
+
+    return inside, iy*columns + ix
+
+
+def extrema(a, chunk=2**24):
+    """
+    Lowest and highest value of an array, ignoring NaNs, read ``chunk``
+    elements at a time along its first axis, so that memory-mapped arrays
+    are never loaded whole.
+
+    :param a:     Array
+    :param chunk: Approximate number of elements read at a time
+
+    :type a:      np.ndarray
+    :type chunk:  int
+
+    :return: tuple
+    """
+    rows = max(1, chunk//max(1, a[0].size))
+    low, high = [], []
+    for i in range(0, a.shape[0], rows):
+        block = np.asarray(a[i:i + rows])
+        low.append(np.nanmin(block))
+        high.append(np.nanmax(block))
+    return min(low), max(high)
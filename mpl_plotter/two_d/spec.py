@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Composition: plot specifications
+--------------------------------
+"""
+
+import inspect
+
+from mpl_plotter.two_d.plotters import line
+
+
+def axis_arg(arg):
+    """
+    Whether a keyword argument refers to a single axis (eg: ``label_x``).
+    """
+    return arg[-2:] in ['_x', '_y']
+
+
+def singular(k):
+    """
+    Singular of a plural keyword argument (eg: ``labels_x`` -> ``label_x``).
+    """
+    return k[:-3] + k[-2:] if axis_arg(k) else k[:-1]
+
+
+# Plurals of the keyword arguments of line
+plurals = frozenset(arg + 's' if not axis_arg(arg) else arg[:-2] + 's' + arg[-2:] for arg in line.__init__.__code__.co_varnames)
+
+# Figure arguments, applied in the last plot only
+figure_args = {
+    'comparison': frozenset(['backend', 'show', 'legend', 'legend_loc', 'resize_axes', 'grid']),
+    'panes':      frozenset(['backend', 'show', 'legend', 'legend_loc']),
+}
+
+# comparison: curve arguments
+curve_args = frozenset(['color', 'line_width', 'plot_label'])
+
+# panes: legend arguments
+legend_args = frozenset(['plot_label', 'plot_labels'])
+
+
+def classify(composer, kwargs):
+    """
+    Split the keyword arguments of ``comparison`` or ``panes`` into
+    groups, popping them from ``kwargs``:
+
+    - ``comparison``: figure, plural and curve arguments
+    - ``panes``: figure, legend and plural arguments
+
+    Each keyword is classified on its own, so that the groups of a set
+    of keyword arguments can be extended with those of another.
+
+    :param composer: ``'comparison'`` or ``'panes'``
+    :param kwargs:   Keyword arguments
+
+    :type composer:  str
+    :type kwargs:    dict
+
+    :return: List of dictionaries: the groups, followed by the remaining keyword arguments
+    """
+    if composer == 'comparison':
+        groups = [figure_args['comparison'], plurals, curve_args]
+    else:
+        groups = [figure_args['panes'], legend_args, plurals]
+
+    groups = [{k: kwargs.pop(k) for k in group & kwargs.keys()} for group in groups]
+
+    return groups + [kwargs]
+
+
+class plot_spec:
+    """
+    Compiled ``comparison`` or ``panes`` plot, to re-apply to new data.
+
+    The keyword arguments are classified (figure, plural, curve and
+    legend arguments) once, on creation, instead of on every call. The
+    classification is then reused by each call with new ``x`` and ``y``.
+    Keyword arguments given on call are classified and added on top.
+
+    Specs are picklable, so that they can be sent to worker processes,
+    as long as their plotting functions and arguments are.
+
+    .. code-block:: python
+
+        spec = plot_spec(panes, line, rows=2, labels_y=['u', 'v'], plot_labels=['a', 'b'])
+
+        for i, (x, y) in enumerate(batches):
+            spec(x, y, filename=f'batch_{i}.png')
+
+    :param composer: ``comparison`` or ``panes``
+    :param f:        Plotting functions, as given to ``composer``
+    :param kwargs:   Keyword arguments of ``composer``
+
+    :type composer:  function
+    :type f:         list of plot or plot
+    """
+
+    def __init__(self, composer, f=None, **kwargs):
+        assert composer.__name__ in figure_args, ValueError('plot_spec: only comparison and panes plots can be compiled')
+
+        self.composer = composer
+        self.f        = f
+
+        # Parameters of the composer itself, passed on as they are
+        parameters = inspect.signature(composer).parameters
+        self.named = {k: kwargs.pop(k) for k in list(kwargs) if k in parameters and k not in ['x', 'y', 'f', 'spec']}
+
+        self.groups = classify(composer.__name__, kwargs)
+
+    def __call__(self, x, y, **kwargs):
+        """
+        Plot new data.
+
+        :param x:      Data
+        :param y:      Data
+        :param kwargs: Keyword arguments of the composer to add to, or override, those of the spec
+        """
+        return self.composer(x, y, self.f, spec=self, **{**self.named, **kwargs})
+
+    def classified(self, kwargs=None):
+        """
+        Copy of the groups of keyword arguments of the spec, extended with
+        those of ``kwargs``.
+
+        :type kwargs: dict
+
+        :return: List of dictionaries (see ``classify``)
+        """
+        groups = [dict(group) for group in self.groups]
+        if kwargs:
+            for group, extra in zip(groups, classify(self.composer.__name__, dict(kwargs))):
+                group.update(extra)
+        return groups
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Streaming
+---------
+"""
+
+import numpy as np
+
+from mpl_plotter.utils import ensure_ndarray
+
+
+class stream:
+    """
+    Streaming mode for ``line`` and ``scatter`` plots.
+
+    The data of the plot is kept in a preallocated ring buffer holding
+    its last ``capacity`` points. Appending writes into the buffer in
+    place, dropping the oldest points once it is full.
+
+    On each draw, only the graph of the plot is redrawn, over a cached
+    background of the rest of the figure (blitting). The axes are
+    resized, and the figure fully redrawn, only when new data falls
+    outside the current axis limits.
+
+    While streaming, the graph is drawn only by the stream: call ``stop``
+    before saving the figure.
+
+    .. code-block:: python
+
+        plot = line(x=x, y=y, show=False)
+        s    = stream(plot, capacity=10000)
+
+        for x, y in sensor:
+            s.append(x, y)
+            s.draw()
+
+    :param plot:     ``line`` or ``scatter`` plot
+    :param capacity: Maximum number of points shown
+    :param blit:     Redraw only the graph when possible
+
+    :type plot:      mpl_plotter.two_d.plotters.plot
+    :type capacity:  int
+    :type blit:      bool
+    """
+
+    def __init__(self, plot, capacity=10000, blit=True):
+        self.plot     = plot
+        self.capacity = capacity
+
+        self.colored  = plot.norm is not None and not callable(plot.norm)
+
+        # Each point is stored twice, at i and i + capacity, so that the
+        # last ``capacity`` points are always a contiguous view of the buffer
+        self.buffers  = {k: np.empty(2*capacity) for k in (['x', 'y', 'norm'] if self.colored else ['x', 'y'])}
+        self.head     = 0           # Position of the next point
+        self.size     = 0           # Number of points stored
+        self.rescale  = False       # New data outside of the axis limits
+
+        # Blitting
+        canvas = plot.fig.canvas
+        self.blit = blit and getattr(canvas, 'supports_blit', False)
+        self.background = None
+        if self.blit:
+            plot.graph.set_animated(True)
+            self.cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+        self.write(plot.x, plot.y, plot.norm if self.colored else None)
+
+    def __len__(self):
+        return self.size
+
+    def data(self, k):
+        """
+        View of the points in buffer ``k`` (``x``, ``y`` or ``norm``), oldest first.
+        """
+        return self.buffers[k][self.head + self.capacity - self.size:self.head + self.capacity]
+
+    def write(self, x, y, norm=None):
+
+        values = {'x': np.atleast_1d(x), 'y': np.atleast_1d(y)}
+        if self.colored:
+            assert norm is not None, 'stream: the plot is colored by norm, append norm values with each point'
+            values['norm'] = np.atleast_1d(norm)
+
+        n = values['x'].size
+        assert all(v.size == n for v in values.values()), 'stream: size mismatch between appended arrays'
+
+        # Only the last ``capacity`` points are kept
+        if n > self.capacity:
+            values = {k: v[-self.capacity:] for k, v in values.items()}
+            n      = self.capacity
+
+        # Written in at most two slices: up to the end of the buffer, and from its start
+        first = min(n, self.capacity - self.head)
+        rest  = n - first
+        for k, v in values.items():
+            buffer = self.buffers[k]
+            for offset in (0, self.capacity):
+                buffer[offset + self.head:offset + self.head + first] = v[:first]
+                buffer[offset:offset + rest]                          = v[first:]
+
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+        return values
+
+    def append(self, x, y, norm=None):
+        """
+        Append one or more points to the stream.
+
+        :param x:    x coordinates
+        :param y:    y coordinates
+        :param norm: Color values, if the plot is colored by ``norm``
+
+        :type x:     float or np.ndarray
+        :type y:     float or np.ndarray
+        :type norm:  float or np.ndarray
+        """
+
+        values = self.write(x, y, norm)
+
+        # Resize the axes only if the new data leaves the current limits
+        if not self.rescale:
+            for k, lims in (('x', self.plot.ax.get_xlim()), ('y', self.plot.ax.get_ylim())):
+                if values[k].min() < min(lims) or values[k].max() > max(lims):
+                    self.rescale = True
+                    break
+
+    def draw(self):
+        """
+        Draw the points in the stream.
+        """
+
+        plot   = self.plot
+        canvas = plot.fig.canvas
+
+        plot.x = self.data('x')
+        plot.y = self.data('y')
+        if self.colored:
+            plot.norm = self.data('norm')
+
+        if self.rescale:
+            # Resize axes and draw the whole figure right away, so that the
+            # background cached by on_draw is not left with the old limits
+            self.rescale = False
+            plot.update()
+            canvas.draw()
+            canvas.flush_events()
+        elif not self.blit or self.background is None:
+            plot.update_graph()
+            canvas.draw_idle()
+        else:
+            plot.update_graph()
+            canvas.restore_region(self.background)
+            plot.ax.draw_artist(plot.graph)
+            canvas.blit(plot.fig.bbox)
+            canvas.flush_events()
+
+    def on_draw(self, event):
+        # Cache the background of the figure after each full draw, in which
+        # the animated graph is not drawn, and then draw the graph over it
+        canvas = self.plot.fig.canvas
+        self.background = canvas.copy_from_bbox(self.plot.fig.bbox)
+        self.plot.ax.draw_artist(self.plot.graph)
+
+    def stop(self):
+        """
+        Stop blitting, so that the graph is drawn with the rest of the figure again.
+        """
+        if self.blit:
+            self.plot.fig.canvas.mpl_disconnect(self.cid)
+            self.plot.graph.set_animated(False)
+            self.blit       = False
+            self.background = None
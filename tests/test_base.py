@@ -52,3 +52,584 @@ class TestAll(unittest.TestCase):
                 surface_edge_color="red",
                 surface_cstride=12,
                 surface_rstride=12)
+
+
+class TestBinding(unittest.TestCase):
+
+    def test_parameters(self):
+        from mpl_plotter.two_d import line
+        from mpl_plotter.methods.binding import binder
+
+        params = binder.parameters(line.__init__)
+        assert 'line_width' in params and 'self' not in params
+
+    def test_bind(self):
+        from mpl_plotter.two_d import scatter
+        from mpl_plotter.methods.binding import binder
+
+        plot = scatter.__new__(scatter)
+        scatter._bind(plot, {**{p: None for p in binder.parameters(scatter.__init__)}, 'scatter_size': 12})
+
+        assert plot.scatter_size == 12 and plot.x is None
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        import sys
+        import subprocess
+
+        lazy = ['pandas', 'toml', 'matplotlib.pyplot', 'mpl_toolkits.mplot3d', 'mpl_plotter.three_d', 'mpl_plotter.presets']
+
+        eager = subprocess.run([sys.executable, '-c',
+                                'import sys; loaded = set(sys.modules); '
+                                'import mpl_plotter, mpl_plotter.two_d; '
+                                f'print(*[m for m in {lazy} if m in set(sys.modules) - loaded])'],
+                               capture_output=True, text=True, check=True).stdout.split()
+
+        assert eager == [], f'modules imported eagerly: {eager}'
+
+
+class TestUpdate(unittest.TestCase):
+
+    x = np.linspace(0, 10, 1000)
+
+    def draw(self, plotter, **kwargs):
+        from mpl_plotter.render import agg_figure
+        return plotter(x=self.x, y=np.sin(self.x), fig=agg_figure(), backend=None, show=False, **kwargs)
+
+    def test_line(self):
+        from mpl_plotter.two_d import line
+
+        plot = self.draw(line)
+        graph = plot.graph
+        plot.update(y=3*np.cos(self.x))
+
+        # Graph modified in place, axes resized to the new data
+        assert plot.graph is graph
+        assert np.allclose(graph.get_ydata(), 3*np.cos(self.x))
+        assert plot.ax.get_ylim()[1] >= 3
+
+    def test_line_norm(self):
+        from mpl_plotter.two_d import line
+
+        plot = self.draw(line, norm=np.sin(self.x))
+        plot.update(x=2*self.x, norm=np.cos(self.x))
+
+        assert np.allclose(plot.graph.get_array(), np.cos(self.x))
+        assert np.allclose(plot.graph.get_segments()[-1][:, 0], 2*self.x[-2:])
+        assert plot.ax.get_xlim()[1] > 19
+
+    def test_scatter(self):
+        from mpl_plotter.two_d import scatter
+
+        plot = self.draw(scatter, norm=np.sin(self.x))
+        plot.update(x=self.x[:10], y=self.x[:10], norm=self.x[:10])
+
+        assert np.allclose(plot.graph.get_offsets(), np.column_stack([self.x[:10]]*2))
+        assert np.allclose(plot.graph.get_array(), self.x[:10])
+        assert plot.ax.get_xlim()[1] < 1
+
+    def test_unsupported(self):
+        from mpl_plotter.two_d import heatmap
+        from mpl_plotter.render import agg_figure
+
+        plot = heatmap(fig=agg_figure(), backend=None, show=False)
+
+        with self.assertRaisesRegex(TypeError, 'heatmap does not support update'):
+            plot.update(x=self.x)
+
+
+class TestStream(unittest.TestCase):
+
+    def draw(self, plotter, **kwargs):
+        from mpl_plotter.render import agg_figure
+        x = np.arange(5, dtype=float)
+        return plotter(x=x, y=x, fig=agg_figure(), backend=None, show=False, **kwargs)
+
+    def test_ring_buffer(self):
+        from mpl_plotter.two_d import line, stream
+
+        s = stream(self.draw(line), capacity=8)
+        buffer = s.buffers['x']
+
+        s.append(np.arange(5, 11), np.arange(5, 11))
+        s.append(11, 11)
+
+        # Oldest points dropped, without reallocating the buffer
+        assert s.buffers['x'] is buffer and len(s) == 8
+        assert np.array_equal(s.data('x'), np.arange(4, 12))
+
+        s.draw()
+        assert np.array_equal(s.plot.graph.get_xdata(), np.arange(4, 12))
+
+    def test_rescale(self):
+        from mpl_plotter.two_d import scatter, stream
+
+        s = stream(self.draw(scatter, norm=np.zeros(5)), capacity=100)
+        s.draw()
+
+        # Within the axis limits: graph blitted over the cached background
+        s.append(2, 2, 1)
+        assert not s.rescale and s.background is not None
+        s.draw()
+        assert np.array_equal(s.plot.graph.get_array(), [0, 0, 0, 0, 0, 1])
+
+        # Outside: axes resized, and the background cached again at once,
+        # even if idle draws are deferred, as on interactive backends
+        background = s.background
+        s.plot.fig.canvas.draw_idle = lambda *args, **kwargs: None
+        s.append(20, 2, 1)
+        assert s.rescale
+        s.draw()
+        assert s.plot.ax.get_xlim()[1] >= 20 and not s.rescale
+        assert s.background is not None and s.background is not background
+
+    def test_stop(self):
+        from mpl_plotter.two_d import line, stream
+
+        s = stream(self.draw(line))
+        assert s.plot.graph.get_animated()
+
+        s.stop()
+        assert not s.plot.graph.get_animated()
+
+
+class TestDecimation(unittest.TestCase):
+
+    x = np.linspace(0, 10, 200000)
+    y = np.sin(x) + np.random.default_rng(0).normal(0, 0.1, x.size)
+
+    def draw(self, **kwargs):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import line
+        return line(x=self.x, y=self.y, fig=agg_figure(), backend=None, show=False, line_decimation=True, **kwargs)
+
+    def test_decimate(self):
+        from mpl_plotter.two_d.reduction import decimate
+
+        i = decimate(self.x, self.y, 0, 10, 100, chunk=5000)
+
+        assert len(i) <= 4*100 + 4*self.x.size//5000 and np.all(np.diff(i) > 0)
+        # Envelope kept
+        assert self.y[i].min() == self.y.min() and self.y[i].max() == self.y.max()
+        assert i[0] == 0 and i[-1] == self.x.size - 1
+
+    def test_bounds(self):
+        plot = self.draw(bounds_x=[2, 4])
+
+        x = plot.graph.get_xdata()
+        # Points within the bounds, and the ones next to them
+        assert x.size < 4000 and (x[1:-1] >= 2).all() and (x[1:-1] <= 4).all()
+        assert x[0] < 2 and x[-1] > 4
+
+    def test_norm(self):
+        plot = self.draw(norm=self.y)
+
+        segments = plot.graph.get_segments()
+        assert len(segments) < 4000 and len(plot.graph.get_array()) == len(segments) + 1
+
+
+class TestDensity(unittest.TestCase):
+
+    x = np.random.default_rng(0).normal(size=100000)
+    y = np.random.default_rng(1).normal(size=100000)
+
+    def draw(self, **kwargs):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import scatter
+        return scatter(x=self.x, y=self.y, fig=agg_figure(), backend=None, show=False, **kwargs)
+
+    def test_density(self):
+        from mpl_plotter.two_d.reduction import density
+
+        image = density(self.x, self.y, None, (-1, 1, -1, 1), (20, 10))
+
+        assert image.shape == (10, 20)
+        assert image.sum() == ((np.abs(self.x) <= 1) & (np.abs(self.y) <= 1)).sum()
+
+        mean = density(np.array([0, 0.1, 1]), np.array([0, 0.1, 1]), np.array([1., 3., 5.]), (0, 1, 0, 1), (2, 2))
+        # Points on the upper bounds in the last pixel, empty pixels masked
+        assert mean[0, 0] == 2 and mean[1, 1] == 5 and mean.mask[0, 1]
+
+    def test_threshold(self):
+        import matplotlib as mpl
+
+        assert isinstance(self.draw(scatter_density=10**6).graph, mpl.collections.PathCollection)
+
+        plot = self.draw(scatter_density=10**4, norm=self.x)
+        assert isinstance(plot.graph, mpl.image.AxesImage)
+        assert plot.graph.get_array().ndim == 2
+        assert plot.graph.get_clim() == (self.x.min(), self.x.max())
+
+    def test_counts(self):
+        plot = self.draw(scatter_density=True)
+
+        # Opacity following the number of points in each pixel
+        image  = plot.graph.get_array()
+        alphas = plot.graph.to_rgba(image)[..., 3][~image.mask]
+        assert plot.graph.get_clim() == (1, image.max())
+        assert alphas.min() == 0.25 and alphas.max() == 1
+
+    def test_update(self):
+        plot = self.draw(scatter_density=True)
+        plot.update(x=self.x[:10], y=self.y[:10])
+
+        assert plot.graph.get_array().sum() == 10
+        assert plot.graph.get_clim() == (1, max(plot.graph.get_array().max(), 2))
+
+
+class TestQuiver(unittest.TestCase):
+
+    def test_bin_means(self):
+        from mpl_plotter.two_d.reduction import bin_means
+
+        x, y, u = bin_means(np.array([0, 0.2, 1, 5]), np.array([0, 0.2, 1, 5]), [np.array([1., 3., 5., 7.])], (0, 1, 0, 1), (2, 2))
+
+        # Cell centers of non-empty cells, points outside of the extent dropped
+        assert np.allclose(x, [0.25, 0.75]) and np.allclose(y, [0.25, 0.75])
+        assert np.allclose(u, [2, 5])
+
+    def test_budget(self):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import quiver
+
+        rng  = np.random.default_rng(0)
+        x, y = rng.random(10**5)*2, rng.random(10**5)
+        u, v = np.ones(10**5), np.zeros(10**5)
+
+        plot = quiver(x=x, y=y, u=u, v=v, quiver_arrows=500, quiver_custom_rule=x,
+                      fig=agg_figure(), backend=None, show=False)
+
+        assert plot.x.size <= 500 and plot.graph.N == plot.x.size
+        assert np.allclose(plot.u, 1) and np.allclose(plot.v, 0)
+        assert plot.color.shape == (3*plot.x.size, 4)
+
+
+class TestStreamline(unittest.TestCase):
+
+    x, y = np.meshgrid(np.linspace(0, 10, 50), np.linspace(0, 5, 40))
+    u, v = np.cos(x), np.sin(y) + 0.1
+
+    def draw(self, **kwargs):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import streamline
+        return streamline(x=self.x, y=self.y, u=self.u, v=self.v, fig=agg_figure(), backend=None, show=False, **kwargs)
+
+    def test_streamplot(self):
+        from mpl_plotter.render import agg_figure
+
+        plot = self.draw()
+
+        # Same lines and arrows as Matplotlib's streamplot
+        ax = agg_figure().add_subplot()
+        s  = ax.streamplot(self.x, self.y, self.u, self.v, color=plot.color, cmap=plot.cmap, density=2)
+        assert np.allclose(np.array(s.lines.get_segments()), np.array(plot.graph.get_segments()))
+        assert np.allclose(s.lines.get_array(), plot.graph.get_array())
+        assert len(ax.patches) == len(plot.ax.patches)
+        assert all(np.allclose(a.get_facecolor(), b.get_facecolor()) for a, b in zip(ax.patches, plot.ax.patches))
+
+    def test_interpgrid(self):
+        from mpl_plotter.two_d.plotters import _interpgrid
+
+        a      = np.arange(12.).reshape(3, 4)**2
+        xi, yi = np.array([0, 1.5, 3, 2.25]), np.array([0, 0.5, 2, 1.75])
+
+        # Bilinear interpolation, clamped at the last row and column
+        expected = [np.interp(x, range(4), [np.interp(y, range(3), a[:, k]) for k in range(4)]) for x, y in zip(xi, yi)]
+        assert np.allclose(_interpgrid(a, xi, yi), expected)
+
+    def test_cache(self):
+        from mpl_plotter.cache import trajectories
+
+        points, starts = self.draw().integrate()
+
+        # Restyling reuses the trajectories
+        plot = self.draw(color='red', streamline_line_width=np.ones_like(self.x))
+        assert plot.integrate()[0] is points
+        assert len(plot.graph.get_segments()) == points.shape[0] - (starts.size - 1)
+
+        # Other densities are integrated anew
+        assert self.draw(streamline_line_density=1).integrate()[0] is not points
+        assert len(trajectories) >= 2
+
+
+class TestSurface(unittest.TestCase):
+
+    def test_face_budget(self):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.three_d import surface
+
+        x, y = np.meshgrid(np.linspace(0, 1, 300), np.linspace(0, 2, 201))
+        z    = x*y
+
+        plot = surface(x=x, y=y, z=z, surface_faces=1000,
+                       fig=agg_figure(), backend=None, show=False)
+
+        # Resampled within the budget, keeping the edges of the grid
+        assert len(plot.graph.get_paths()) <= 1000
+        assert plot.x[0, -1] == 1 and plot.y[-1, 0] == 2 and plot.z[-1, -1] == 2
+
+    def test_strides(self):
+        from mpl_plotter.three_d import surface
+
+        plot = surface.__new__(surface)
+        plot.surface_rstride, plot.surface_cstride = 1, 3
+
+        plot.surface_faces = 10**6
+        assert plot.strides(101, 301) == (1, 3)
+        plot.surface_faces = 100
+        r, c = plot.strides(101, 301)
+        assert -(-100//r)*-(-300//c) <= 100 and c >= 3
+
+
+class TestShading(unittest.TestCase):
+
+    x, y = np.meshgrid(np.linspace(-3, 3, 120), np.linspace(-3, 3, 100))
+    z    = np.sin(x)*np.cos(y) + 0.1*x
+
+    def test_shade(self):
+        import matplotlib as mpl
+        from matplotlib.colors import LightSource
+        from mpl_plotter.three_d.shading import shade
+
+        reference = LightSource(270, 45).shade(self.z, cmap=mpl.colormaps['viridis'], vert_exag=0.1, blend_mode='soft')
+
+        assert np.allclose(shade(self.z, 'viridis', dtype='float64'), reference)
+        # Single precision: a few values fall on the neighboring colormap level
+        assert np.median(np.abs(shade(self.z, 'viridis') - reference)) < 1e-5
+
+    def test_cache(self):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.three_d import surface
+        from mpl_plotter.three_d.shading import shade
+        from mpl_plotter.color.maps import closest, _closest
+
+        rgba = shade(self.z, 'viridis', azdeg=90)
+        assert shade(self.z.copy(), 'viridis', azdeg=90) is rgba
+        assert shade(self.z, 'viridis', azdeg=180) is not rgba
+
+        hits = _closest.cache_info().hits
+        for _ in range(2):
+            with self.assertWarns(UserWarning):
+                plot = surface(x=self.x, y=self.y, z=self.z, surface_lighting=True, color='Blue',
+                               fig=agg_figure(), backend=None, show=False)
+        assert closest('Blue') == 'Blues' and _closest.cache_info().hits > hits
+        plot.fig.canvas.draw()
+        assert len(plot.graph.get_facecolor()) == (self.z.shape[0] - 1)*(self.z.shape[1] - 1)
+
+
+class TestFillArea(unittest.TestCase):
+
+    def plot(self, x, y, z):
+        from mpl_plotter.two_d import fill_area
+        plot = fill_area.__new__(fill_area)
+        plot.x, plot.y, plot.z = x, y, z
+        return plot
+
+    def test_envelopes(self):
+        x = np.linspace(-6, 6, 1000)
+        plot = self.plot(x, np.sin(x), np.cos(x))
+
+        assert np.array_equal(plot.i_below(), [min(a, b) for a, b in zip(plot.y, plot.z)])
+        assert np.array_equal(plot.i_above(), [max(a, b) for a, b in zip(plot.y, plot.z)])
+
+    def test_intersection(self):
+        x, y = self.plot(np.array([0., 1., 2., 3.]),
+                         np.array([0., 2., 1., 1.]),
+                         np.array([1., 1., 1., 2.])).intersection()
+
+        # Crossing between samples 0 and 1, and sample 2, where the curves meet
+        assert np.allclose(x, [0.5, 2]) and np.allclose(y, [1, 1])
+
+
+class TestMockData(unittest.TestCase):
+
+    def test_size(self):
+        from mpl_plotter.two_d.mock import MockData
+
+        x, y, z = MockData().filled_julia(size=64)
+        assert z.shape == (64, 64) and x.size == y.size == 64
+
+        x, y = MockData().spirograph(size=1000)
+        assert x.shape == y.shape == (1000,)
+
+    def test_filled_julia(self):
+        from mpl_plotter.two_d.mock import MockData
+
+        w = h = 32
+        _, _, z = MockData().filled_julia(size=w)
+
+        # Escape time of a single pixel, iterated as a scalar
+        for x, y in [(0, 0), (16, 16), (20, 9)]:
+            zx = 1.5 * (x - w / 2) / (0.5 * w)
+            zy = 1.0 * (y - h / 2) / (0.5 * h)
+            i = 255
+            while zx * zx + zy * zy < 4 and i > 1:
+                zx, zy = zx * zx - zy * zy - 0.7, 2.0 * zx * zy + 0.27015
+                i -= 1
+            assert z[x, y] == (i << 21) + (i << 10) + i * 8
+
+
+class TestCache(unittest.TestCase):
+
+    def test_read_only(self):
+        from mpl_plotter.two_d.mock import MockData
+
+        x, y, z = MockData().waterdrop(size=50)
+
+        # Shared across calls, and read-only
+        assert MockData().waterdrop(size=50)[2] is z
+        with self.assertRaises(ValueError):
+            z[0, 0] = 1
+
+    def test_memory_cap(self):
+        from mpl_plotter.cache import cache
+
+        c = cache(max_bytes=3*800)
+        for i in range(4):
+            c.put(i, np.zeros(100))
+        c.get(1)
+        c.put(4, np.zeros(100))
+
+        # Least recently used evicted
+        assert list(c.values) == [3, 1, 4] and c.nbytes == 3*800
+        # Larger than the cap: returned, not stored
+        assert c.put(5, np.zeros(1000)).size == 1000 and 5 not in c
+
+    def test_keys(self):
+        from mpl_plotter.cache import cache
+
+        c = cache()
+        calls = []
+
+        class data:
+            @c.method
+            def ones(self, size=10):
+                calls.append(size)
+                return np.ones(size)
+
+        data().ones()
+        data().ones(size=10)
+        data().ones(20)
+
+        # Default and explicit arguments share a key
+        assert calls == [10, 20]
+
+
+class TestColormaps(unittest.TestCase):
+
+    def test_lookup(self):
+        import matplotlib as mpl
+        from mpl_plotter.color.maps import colors, lut
+
+        values = np.concatenate([np.linspace(0, 1, 1001), [np.nan]])
+
+        # Same colors as calling the colormap
+        assert np.allclose(colors(values, 'viridis'), mpl.colormaps['viridis'](values), atol=1e-6)
+        # Resolved once
+        assert lut('viridis') is lut('viridis')
+        assert colors(np.zeros((3, 5)), 'viridis').shape == (3, 5, 4)
+
+    def test_register(self):
+        from mpl_plotter.color.maps import custom, mapstack, lut
+
+        stack = mapstack(['Blues_r', 'Reds'])
+        assert lut(stack.name) is lut(stack)
+        assert np.allclose(lut(stack), stack(np.linspace(0, 1, stack.N)), atol=1e-6)
+
+        # Stacks named after their colors
+        other = mapstack(['Greens_r', 'Reds'])
+        assert other.name != stack.name and mapstack(['Blues_r', 'Reds']).name == stack.name
+        assert not np.allclose(lut(other.name), lut(stack.name))
+
+        # Colormaps registered under the same name replace each other
+        heat = custom([(0, 0, 0), (1, 1, 1)], [(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (1, 0, 0)], name='heat', n=8)
+        assert np.allclose(lut('heat')[-1], [1, 0, 0, 1])
+        cold = custom([(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (1, 1, 1)], name='heat', n=8)
+        assert np.allclose(lut(heat)[-1], [1, 0, 0, 1]) and np.allclose(lut(cold)[-1], [0, 0, 1, 1])
+
+    def test_builtin_names(self):
+        import matplotlib as mpl
+        from mpl_plotter.color.maps import custom, colors, lut
+
+        # Matplotlib colormap names cannot be taken
+        with self.assertRaises(ValueError):
+            custom([(0, 0, 0), (1, 1, 1)], [(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (1, 0, 0)], name='viridis', n=8)
+
+        # Nor shadowed by colormap objects sharing them
+        gray = mpl.colors.ListedColormap(['black', 'white'], name='viridis')
+        assert np.allclose(lut(gray), [[0, 0, 0, 1], [1, 1, 1, 1]])
+        assert np.allclose(colors(np.linspace(0, 1, 11), 'viridis'), mpl.colormaps['viridis'](np.linspace(0, 1, 11)), atol=1e-6)
+
+
+class TestHeatmap(unittest.TestCase):
+
+    def draw(self, x, y, z):
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import heatmap
+        return heatmap(x=x, y=y, z=z, fig=agg_figure(), backend=None, show=False)
+
+    def test_uniform(self):
+        import matplotlib as mpl
+
+        x, y = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 2, 5))
+        plot = self.draw(x, y, x*y)
+
+        assert type(plot.graph) is mpl.image.AxesImage
+        # Cells centered on the coordinates
+        assert np.allclose(plot.graph.get_extent(), [-0.05, 1.05, -0.25, 2.25])
+
+    def test_non_uniform(self):
+        import matplotlib as mpl
+
+        x = np.array([0, 1, 3, 7])
+        plot = self.draw(x, np.array([2, 1, 0]), np.ones((3, 4)))
+
+        assert type(plot.graph) is mpl.image.NonUniformImage
+        # Sorted in ascending order
+        assert np.array_equal(plot.graph._Ay, [0, 1, 2])
+
+    def test_curvilinear(self):
+        import matplotlib as mpl
+
+        x, y = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 2, 5))
+        plot = self.draw(x + y, y, x*y)
+
+        assert isinstance(plot.graph, mpl.collections.QuadMesh)
+
+    def test_single_row_column(self):
+        import matplotlib as mpl
+
+        # Drawn by pcolormesh
+        row    = self.draw(np.arange(5.), np.array([0.]), np.ones((1, 5)))
+        column = self.draw(np.array([0.]), np.arange(5.), np.ones((5, 1)))
+
+        assert isinstance(row.graph, mpl.collections.QuadMesh) and isinstance(column.graph, mpl.collections.QuadMesh)
+
+    def test_memmap(self):
+        import os
+        import tempfile
+
+        x = np.linspace(-1, 1, 3000)
+        z = np.outer(x, x)
+        z[0, 0] = 2
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'z.npy')
+            np.save(path, z)
+
+            plot = self.draw(x, x, path)
+
+            assert isinstance(plot.z, np.memmap)
+            # Read at the resolution of the axes, with the color limits of the whole of z
+            assert plot.graph.get_array().shape[0] < 3000
+            assert plot.graph.get_clim() == (-1, 2)
+
+            del plot
+
+    def test_mock(self):
+        plot = self.draw(None, None, None)
+
+        # Coordinate vectors, no meshes
+        assert plot.x.ndim == plot.y.ndim == 1 and plot.z.shape == (plot.y.size, plot.x.size)
@@ -97,3 +97,144 @@ class TestsPlotters(unittest.TestCase):
                    show=show, backend=backend,
                    aspect=1
                    )
+
+
+class TestLegendLayout(unittest.TestCase):
+
+    def test_no_file_io(self):
+        import io
+        import os
+        import tempfile
+        import matplotlib.pyplot as plt
+        from unittest import mock
+
+        # Read-only home directory
+        with tempfile.TemporaryDirectory() as home:
+            os.chmod(home, 0o500)
+            with mock.patch.dict(os.environ, {'HOME': home}):
+                comparison([x], [u, v], plot_labels=["sin", "cos"], legend=True, show=False, backend=None)
+            assert os.listdir(home) == []
+
+        # Same legend placement as saving the figure
+        legend = plt.gcf().legends[0] if plt.gcf().legends else plt.gca().get_legend()
+        placed = legend.get_window_extent().bounds
+        plt.savefig(io.BytesIO(), format='pdf')
+        assert legend.get_window_extent().bounds == placed
+
+
+class TestDeferred(unittest.TestCase):
+
+    def test_single_finish(self):
+        import matplotlib.pyplot as plt
+        from mpl_plotter.timing import timer
+
+        ys = [np.sin(x*k) for k in range(1, 21)]
+
+        plt.close('all')
+        figures = []
+        for deferred in (False, True):
+            with timer() as t:
+                comparison([x]*20, ys, autocolor=False, deferred=deferred, show=False, backend=backend)
+            figures.append((plt.gca().get_xlim(), plt.gca().get_ylim(), list(plt.gca().get_yticks()), len(plt.gca().lines)))
+            plt.close('all')
+
+            stats = t.stats()
+            assert stats['plot']['count'] == 20
+            assert stats['method_tick_locs']['count'] == (1 if deferred else 20)
+            assert stats['method_save']['count'] == (1 if deferred else 20)
+
+        # Same axes either way
+        assert figures[0] == figures[1]
+
+    def test_thread_local(self):
+        import threading
+        from mpl_plotter.render import agg_figure
+        from mpl_plotter.two_d import deferred
+
+        plots = []
+        draw  = lambda: plots.append(line(x=x, y=u, label_x='x', fig=agg_figure(), backend=None, show=False))
+
+        # Plots in other threads are finished as usual
+        with deferred():
+            thread = threading.Thread(target=draw)
+            thread.start()
+            thread.join()
+            draw()
+
+        assert [plot.ax.get_xlabel() for plot in plots] == ['x', '']
+
+
+class TestCollection(unittest.TestCase):
+
+    def test_ensemble(self):
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
+        plt.close('all')
+        ys = np.cumsum(np.random.default_rng(0).normal(size=(300, x.size)), axis=1)
+
+        comparison(x, ys, collection=True, line_widths=np.linspace(0.5, 1, 300), plot_labels=['a', 'b'],
+                   show=False, backend=backend)
+
+        # A single collection, one path per curve, and a legend entry per label
+        ax = plt.gca()
+        assert len(ax.collections) == 1 and len(ax.collections[0].get_paths()) == 300
+        assert len(ax.collections[0].get_linewidths()) == 300
+        assert [t.get_text() for t in plt.gcf().legends[0].get_texts()] == ['a', 'b']
+        assert ax.get_ylim()[0] < ys.min() and ax.get_ylim()[1] > ys.max()
+
+    def test_norm(self):
+        from mpl_plotter.render import agg_figure
+
+        ys = np.array([u, v, w])
+        plot = line(x=x, y=ys, norm=ys, line_width=[1, 2, 3], fig=agg_figure(), backend=None, show=False)
+
+        # Segments of all curves, colored by norm
+        assert len(plot.graph.get_segments()) == 3*(x.size - 1)
+        assert np.array_equal(plot.graph.get_array(), ys[:, :-1].ravel())
+        assert np.array_equal(plot.graph.get_linewidths(), np.repeat([1, 2, 3], x.size - 1))
+
+    def test_curve_and_plural(self):
+        import matplotlib.pyplot as plt
+
+        # Curve arguments take precedence over their plurals
+        plt.close('all')
+        comparison(x, np.array([u, v]), collection=True, color='red', colors=['C0', 'C1'],
+                   plot_label='a', plot_labels=['b', 'c'], show=False, backend=backend)
+        assert np.allclose(plt.gca().collections[0].get_colors(), [1, 0, 0, 1])
+        assert [t.get_text() for t in plt.gcf().legends[0].get_texts()] == ['a']
+        plt.close('all')
+
+    def test_lines_only(self):
+        with self.assertRaises(AssertionError):
+            comparison(x, np.array([u, v]), [line, scatter], collection=True, show=False, backend=backend)
+
+
+class TestSpec(unittest.TestCase):
+
+    def test_reuse(self):
+        import pickle
+        import matplotlib.pyplot as plt
+        from mpl_plotter.two_d import plot_spec
+
+        def drawn():
+            lines = [(l.get_color(), l.get_linewidth(), l.get_label()) for l in plt.gca().lines]
+            plt.close('all')
+            return lines
+
+        kwargs = dict(colors=['red', 'blue'], line_widths=[1, 2], plot_labels=['sin', 'cos'], labels_x=['x', 'x'],
+                      show=False, backend=backend)
+
+        plt.close('all')
+        comparison([x], [u, v], **kwargs)
+        direct = drawn()
+
+        # Compiled once, picklable, and re-applied to new data
+        spec = pickle.loads(pickle.dumps(plot_spec(comparison, **kwargs)))
+        for y in ([u, v], [uu, vv]):
+            spec([x], y)
+            assert drawn() == direct
+
+        # Keyword arguments added on call
+        spec([x], [u, v], line_widths=[3, 4])
+        assert [lw for _, lw, _ in drawn()] == [3, 4]
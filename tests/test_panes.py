@@ -305,3 +305,78 @@ class TestsPlurals(unittest.TestCase):
                       [colorscheme_one()[2], colorscheme_one()[3]],
                       [colorscheme_one()[4], colorscheme_one()[5]]],
               show=show, backend=backend)
+
+
+class TestParallel(unittest.TestCase):
+
+    def render(self, parallel, f):
+        import os
+        import tempfile
+        import matplotlib.pyplot as plt
+        from matplotlib.image import imread
+
+        plt.close('all')
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'panes.png')
+            panes(x,
+                  [[u, uu], [v, vv], [y, yy], [u, vv]],
+                  f,
+                  rows=2,
+                  labels_y=["u", "v", "y", "w"],
+                  plot_labels=["a", "b"],
+                  filename=filename, dpi=50,
+                  parallel=parallel, workers=2,
+                  backend=backend)
+            plt.close('all')
+            return imread(filename)
+
+    def test_tiles(self):
+        from mpl_plotter.two_d import line
+
+        serial = self.render(False, line)
+        tiled  = self.render(True, line)
+
+        # Same output as the serial path: axes, labels and legend in place
+        self.assertEqual(tiled.shape, serial.shape)
+        self.assertEqual(tiled.shape[:2], (400, 500))
+        self.assertLessEqual(np.abs(tiled[..., :3] - serial[..., :3]).max(), 2/255)
+
+    def test_unpicklable(self):
+        from mpl_plotter.two_d import line
+
+        # Plotting functions which cannot be sent to workers are drawn serially
+        f = lambda **kwargs: line(**kwargs)
+        self.assertLessEqual(np.abs(self.render(True, f) - self.render(False, line)).max(), 2/255)
+
+    def test_line_collection_legend(self):
+        from matplotlib.collections import LineCollection
+        from mpl_plotter.two_d.panes import _proxy
+
+        # Legend entries of line collections are line samples
+        kind, props = _proxy(LineCollection([], colors='red', linewidths=2))
+        self.assertEqual(kind, 'line')
+        self.assertEqual((props['color'], props['linewidth']), ((1.0, 0.0, 0.0, 1.0), 2))
+
+
+class TestSpec(unittest.TestCase):
+
+    def test_reuse(self):
+        import pickle
+        import matplotlib.pyplot as plt
+        from mpl_plotter.two_d import line, plot_spec
+
+        spec = pickle.loads(pickle.dumps(plot_spec(panes, line,
+                                                   labels_y=["u", "v"],
+                                                   plot_labels=["a", "b"],
+                                                   colors=[["red", "blue"], ["green", "black"]],
+                                                   show=False, backend=backend)))
+
+        for ys in ([[u, uu], [v, vv]], [[v, vv], [y, yy]]):
+            plt.close('all')
+            spec(x, ys)
+
+            fig = plt.gcf()
+            assert [ax.get_ylabel() for ax in fig.axes] == ["u", "v"]
+            assert [[l.get_color() for l in ax.lines] for ax in fig.axes] == [["red", "blue"], ["green", "black"]]
+            assert [t.get_text() for t in fig.legends[0].get_texts()] == ["a", "a", "b", "b"]      # Labels per pane
+        plt.close('all')
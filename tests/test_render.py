@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+import numpy as np
+
+from mpl_plotter import render_batch
+from mpl_plotter.two_d import line, scatter, heatmap
+from mpl_plotter.three_d import surface
+
+
+x = np.linspace(0, np.pi/4, 50)
+
+
+class TestRenderBatch(unittest.TestCase):
+
+    def test_render_batch(self):
+        import matplotlib.pyplot as plt
+
+        fignums = plt.get_fignums()
+
+        pngs = render_batch([(line,    {'x': x, 'y': np.sin(x)}),
+                             (scatter, {'x': x, 'y': np.cos(x)}),
+                             (heatmap, {}),
+                             (surface, {})])
+
+        assert all(png[:8] == b'\x89PNG\r\n\x1a\n' for png in pngs)
+        # No figures are registered in Pyplot
+        assert plt.get_fignums() == fignums
+
+    def test_render_batch_fmt(self):
+
+        pdf, = render_batch([(line, {'x': x, 'y': np.sin(x)})], fmt='pdf')
+
+        assert pdf[:4] == b'%PDF'
+
+
+class TestRenderParallel(unittest.TestCase):
+
+    def test_render_parallel(self):
+        from mpl_plotter import render_parallel, RenderError
+
+        specs = [(line, {'x': x, 'y': x**n}) for n in range(4)]
+        specs.insert(2, (line, {'x': x, 'y': x[:3]}))      # Size mismatch
+
+        results = render_parallel(specs, workers=2)
+
+        assert len(results) == len(specs)
+        assert isinstance(results[2], RenderError) and results[2].index == 2
+        # Submission order
+        assert results[:2] + results[3:] == render_batch(specs[:2] + specs[3:])
+
+
+    def test_unpicklable(self):
+        from mpl_plotter import render_parallel, RenderError
+
+        specs = [(line, {'x': x, 'y': x**n}) for n in range(3)]
+        specs.insert(1, (line, {'x': x, 'y': x, 'norm': lambda x: x}))
+
+        results = render_parallel(specs, workers=2, chunksize=2)
+
+        # Only the spec which cannot be pickled fails
+        assert isinstance(results[1], RenderError) and results[1].index == 1 and 'pickle' in results[1].traceback
+        assert results[:1] + results[2:] == render_batch(specs[:1] + specs[2:])
+
+    def test_worker_crash(self):
+        from mpl_plotter import render_parallel, RenderError
+
+        specs = [(line, {'x': x, 'y': x**n}) for n in range(3)]
+        specs.insert(1, (crashing, {}))
+
+        results = render_parallel(specs, workers=2, chunksize=2)
+
+        # Only the spec terminating its worker fails, not the rest of its chunk
+        assert isinstance(results[1], RenderError) and results[1].index == 1
+        assert results[:1] + results[2:] == render_batch(specs[:1] + specs[2:])
+
+
+class crashing(line):
+
+    def __init__(self, **kwargs):
+        import os
+        os._exit(1)
+
+
+class TestFigurePool(unittest.TestCase):
+
+    def test_pool_reuse(self):
+        from mpl_plotter import figure_pool
+
+        pool  = figure_pool(size=1)
+        specs = [(line,    {'x': x, 'y': np.sin(x), 'tick_rotation_x': 30, 'plot_label': 'sin', 'legend': True}),
+                 (scatter, {'x': x, 'y': np.cos(x), 'spines_removed': None}),
+                 (line,    {'x': x, 'y': np.tan(x), 'label_x': 'x', 'label_coords_x': (0.5, -0.3)}),
+                 (line,    {'x': x, 'y': np.tan(x), 'label_x': 'x'})]
+
+        # Pooled figures are reset between uses
+        assert render_batch(specs, pool=pool) == render_batch(specs)
+        assert len(pool) == 1
+
+    def test_pool_hidden_axes(self):
+        from mpl_plotter import figure_pool
+
+        pool  = figure_pool(size=1)
+        specs = [(surface, {'show_axes': False}),
+                 (surface, {})]
+
+        # Axes hidden by a previous plot are shown again
+        assert render_batch(specs, pool=pool) == render_batch(specs)
+
+    def test_pool_eviction(self):
+        from mpl_plotter import figure_pool
+
+        pool = figure_pool(size=2)
+
+        figures = [pool.acquire(figsize=(n, n)) for n in range(1, 4)]
+        for fig, ax in figures:
+            pool.release(fig)
+
+        # The least recently released layout is evicted
+        assert len(pool) == 2 and ((1, 1), 111, None) not in pool.idle
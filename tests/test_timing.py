@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+import numpy as np
+
+from mpl_plotter import render_batch
+from mpl_plotter.timing import timer
+from mpl_plotter.two_d import line, heatmap
+from mpl_plotter.three_d import surface
+
+
+x = np.linspace(0, np.pi/4, 50)
+
+
+class TestTimer(unittest.TestCase):
+
+    def test_records(self):
+
+        with timer() as t:
+            render_batch([(line,    {'x': x, 'y': np.sin(x)}),
+                          (heatmap, {}),
+                          (surface, {})])
+
+        assert [plotter for plotter, _ in t.records] == ['line', 'heatmap', 'surface']
+        for _, record in t.records:
+            assert {'method_setup', 'mock', 'plot', 'method_save'} <= set(record)
+            assert all(duration >= 0 for duration in record.values())
+        # 3D-only stages
+        assert 'method_pane_fill' in t.records[2][1] and 'method_pane_fill' not in t.records[0][1]
+
+    def test_stats(self):
+
+        with timer() as t:
+            render_batch([(line, {'x': x, 'y': np.sin(x)})]*3)
+
+        stats = t.stats()
+
+        assert stats['plot']['count'] == 3
+        assert np.isclose(stats['plot']['total'], sum(record['plot'] for _, record in t.records))
+        assert stats['plot']['min'] <= stats['plot']['mean'] <= stats['plot']['max']
+        assert 'method_tick_locs' in t.report()
+
+    def test_callback(self):
+
+        calls = []
+        with timer(callback=lambda plot, stage, duration: calls.append((type(plot), stage))):
+            render_batch([(line, {'x': x, 'y': np.sin(x)})])
+
+        assert (line, 'plot') in calls
+        # Each stage is reported once: nested stages count towards their caller
+        assert len(calls) == len(set(calls))
+
+    def test_inactive(self):
+
+        with timer() as t:
+            pass
+        render_batch([(line, {'x': x, 'y': np.sin(x)})])
+
+        assert t.records == []
+
+    def test_thread_local(self):
+        import threading
+
+        # Each thread records its own plots only
+        timers = {}
+        def run(name, n):
+            with timer() as timers[name]:
+                render_batch([(line, {'x': x, 'y': np.sin(x)})]*n)
+
+        threads = [threading.Thread(target=run, args=(name, n)) for name, n in (('a', 1), ('b', 3))]
+        with timer() as outer:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(timers['a'].records) == 1 and len(timers['b'].records) == 3
+        assert outer.records == []